@@ -17,8 +17,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-from qi_link.sensor_array import SensorArray
-from qi_link.fate_engine import FateEngine
+from qi_link.sensor_array import get_sensor_array
+from qi_link.fate_engine import FateEngine, get_engine
 from qi_link.alchemist import Alchemist
 from qi_link.ether_link import EtherLink
 from qi_link.talisman_generator import TalismanGenerator
@@ -925,7 +925,7 @@ def render_sidebar():
         st.markdown("---")
         st.markdown('<p class="sidebar-section">Node Status</p>', unsafe_allow_html=True)
         
-        sensor = SensorArray()
+        sensor = get_sensor_array()
         metrics = sensor.get_live_metrics()
         
         st.markdown(f"""
@@ -1685,8 +1685,8 @@ def render_diagnosis_card(diagnosis, env_data: dict = None):
     """Render diagnosis results card with lucky guide included."""
     remedy_badges = " ".join(render_element_badge(e) for e in diagnosis.remedy_elements)
     
-    # Extract just the imbalance type (before the dash)
-    imbalance_short = diagnosis.imbalance_description.split(' - ')[0] if ' - ' in diagnosis.imbalance_description else diagnosis.imbalance_description[:50]
+    # Just the imbalance type (before the dash), computed once per diagnosis
+    imbalance_short = diagnosis.imbalance_short
     
     # Lucky Guide data
     fate = diagnosis.fate_profile
@@ -1777,9 +1777,12 @@ def main():
     # Store time_unknown in session state for display purposes
     st.session_state.time_unknown = time_unknown
     
+    # Real-world environment captured by the sidebar (read once per rerun)
+    real_env = st.session_state.get("real_env")
+    
     # Initialize components
-    sensor = SensorArray()
-    fate_engine = FateEngine()
+    sensor = get_sensor_array()
+    fate_engine = get_engine()
     alchemist = Alchemist()
     ether_link = EtherLink()
     generator = TalismanGenerator()
@@ -1801,8 +1804,7 @@ def main():
             time.sleep(0.5)
             
             progress_text.markdown("**Step 3/4:** Analyzing elemental balance...")
-            real_env_data = getattr(st.session_state, 'real_env', None)
-            diagnosis = alchemist.diagnose(fate_profile, env_reading, real_env_data)
+            diagnosis = alchemist.diagnose(fate_profile, env_reading, real_env)
             progress_bar.progress(75)
             time.sleep(0.5)
             
@@ -1832,22 +1834,19 @@ def main():
         
         # Two columns - balanced content
         col_left, col_right = st.columns([1, 1])
-        env_data = getattr(st.session_state, 'real_env', None)
         
         with col_left:
             render_fate_card(st.session_state.fate_profile, fate_engine)
         
         with col_right:
-            render_diagnosis_card(st.session_state.diagnosis, env_data)
+            render_diagnosis_card(st.session_state.diagnosis, real_env)
             render_blockchain_card(st.session_state.metadata)
         
         # Download - full width
         st.markdown('<div class="tree-divider"></div>', unsafe_allow_html=True)
-        import json
-        nft_json = ether_link.generate_nft_json(st.session_state.metadata)
         st.download_button(
             label="Download NFT Metadata",
-            data=json.dumps(nft_json, indent=2, ensure_ascii=False),
+            data=ether_link.generate_nft_bytes(st.session_state.metadata),
             file_name=f"qi-link-talisman-{st.session_state.metadata.token_id[:8]}.json",
             mime="application/json",
             use_container_width=True
@@ -20,8 +20,8 @@ from qi_link.models import (
     Diagnosis,
     TalismanMetadata,
 )
-from qi_link.sensor_array import SensorArray
-from qi_link.fate_engine import FateEngine
+from qi_link.sensor_array import SensorArray, get_sensor_array
+from qi_link.fate_engine import FateEngine, get_engine
 from qi_link.alchemist import Alchemist
 from qi_link.ether_link import EtherLink
 from qi_link.talisman_generator import TalismanGenerator
@@ -35,7 +35,9 @@ __all__ = [
     "Diagnosis",
     "TalismanMetadata",
     "SensorArray",
+    "get_sensor_array",
     "FateEngine",
+    "get_engine",
     "Alchemist",
     "EtherLink",
     "TalismanGenerator",
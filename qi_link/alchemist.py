@@ -11,13 +11,177 @@ Now incorporates real-world Feng Shui factors:
 - Weather conditions (humidity, wind)
 """
 
-from typing import Optional, Dict, Any
+import sys
+from functools import lru_cache
+from typing import Optional, Dict, Any, NamedTuple, Tuple
 
 from qi_link.config import get_settings
 from qi_link.exceptions import AlchemyError, ElementImbalanceError
 from qi_link.models import Diagnosis, Element, EnergyState, EnvironmentReading, FateProfile
 
 
+class EnvironmentModifiers(NamedTuple):
+    """Real-world modifiers derived from weather, compass and location data."""
+
+    temperature_influence: str = "moderate"  # 'hot', 'cold', 'moderate'
+    humidity_influence: str = "moderate"  # 'wet', 'dry', 'moderate'
+    direction_element: Optional[Element] = None  # Element from facing direction
+    direction_name: Optional[str] = None  # Cardinal direction name
+    weather_condition: Optional[str] = None  # Current weather
+    location: Optional[str] = None  # City/region
+    ambient_temp: Optional[float] = None
+
+
+# Neutral modifiers used when no real-world data is available
+_NO_MODIFIERS = EnvironmentModifiers()
+
+
+# Fixed element order for list-indexed scoring (avoids a per-call score dict)
+_ELEMENTS = tuple(Element)
+_ELEMENT_INDEX = {element: i for i, element in enumerate(_ELEMENTS)}
+_METAL, _WOOD, _WATER, _FIRE, _EARTH = (
+    _ELEMENT_INDEX[e] for e in (Element.METAL, Element.WOOD, Element.WATER, Element.FIRE, Element.EARTH)
+)
+
+
+# Weather keywords in match priority order, and the text each one contributes
+_WEATHER_KEYWORDS = ("rain", "clear", "sunny", "cloud")
+_WEATHER_DESCRIPTIONS = {
+    "rain": "Rain enhances Water element influence.",
+    "clear": "Clear skies strengthen Fire/Metal clarity.",
+    "sunny": "Clear skies strengthen Fire/Metal clarity.",
+    "cloud": "Cloudy conditions moderate elemental extremes.",
+}
+_WEATHER_PROMPTS = {
+    "rain": ", with mystical rain drops falling through the digital void",
+    "clear": ", under a clear digital sky with stars",
+    "cloud": ", with ethereal clouds of data mist",
+}
+
+
+def _classify_weather(condition: Optional[str]) -> Optional[str]:
+    """Reduce a free-text weather condition to its first matching keyword."""
+    if not condition:
+        return None
+    condition = condition.lower()
+    for keyword in _WEATHER_KEYWORDS:
+        if keyword in condition:
+            return keyword
+    return None
+
+
+@lru_cache(maxsize=256)
+def _enhanced_description(
+    base_description: str,
+    temperature_influence: str,
+    ambient_temp: Optional[int],
+    direction_name: Optional[str],
+    direction_element: Optional[Element],
+    weather: Optional[str],
+) -> str:
+    """
+    Compose the imbalance description with real-world factors.
+
+    Weather and facing direction change slowly, so results are memoized on
+    the (rounded) modifier signature. ``weather`` is a classified keyword.
+    """
+    description = base_description
+
+    # Add temperature influence
+    if temperature_influence == "hot":
+        temp = 30 if ambient_temp is None else ambient_temp
+        description += f" Hot environment ({temp:.0f}C) intensifies Fire energy."
+    elif temperature_influence == "cold":
+        temp = 10 if ambient_temp is None else ambient_temp
+        description += f" Cold environment ({temp:.0f}C) amplifies Water energy."
+
+    # Add direction influence
+    if direction_name and direction_element:
+        description += f" Facing {direction_name} channels {direction_element.value.title()} energy."
+
+    # Add weather condition
+    if weather:
+        description += " " + _WEATHER_DESCRIPTIONS[weather]
+
+    return description
+
+
+# Talisman visuals per remedy element: (color palette, symbols)
+_ELEMENT_VISUALS = {
+    Element.METAL: ("silver and white", "geometric patterns, crystals, circuits"),
+    Element.WOOD: ("emerald green and cyan", "bamboo, vines, digital roots"),
+    Element.FIRE: ("crimson and orange", "flames, phoenixes, plasma arcs"),
+    Element.WATER: ("deep blue and aqua", "waves, dragons, data streams"),
+    Element.EARTH: ("golden amber and brown", "mountains, hexagons, solid foundations"),
+}
+
+# Qualities each remedy element channels
+_ELEMENT_POWERS = {
+    Element.METAL: "clarity and structure",
+    Element.WOOD: "growth and flexibility",
+    Element.WATER: "wisdom and adaptability",
+    Element.FIRE: "passion and transformation",
+    Element.EARTH: "stability and grounding",
+}
+
+# Facing advice to draw in the primary remedy element
+_REMEDY_DIRECTION_ADVICE = {
+    Element.FIRE: "Face South to harness Fire energy, or add Wood (green plants, growth activities) as a bridge - Water generates Wood, Wood generates Fire.",
+    Element.WATER: "Face North to channel Water wisdom, or embrace Metal (white, clarity, structure) which generates Water.",
+    Element.WOOD: "Face East to absorb Wood's growth energy, or connect with Water (meditation, flow) which nourishes Wood.",
+    Element.METAL: "Face West to receive Metal's clarity, or cultivate Earth (stability, grounding) which generates Metal.",
+    Element.EARTH: "Face Southwest or Northeast for Earth grounding, or kindle Fire (passion, action) which creates Earth.",
+}
+
+_TALISMAN_PROMPT_TEMPLATE = """A mystical cyberpunk Taoist talisman, hyper-detailed digital art, 8K resolution.
+Central motif: The {star_name} constellation rendered as a glowing neon sigil, surrounded by {symbol_elements}.
+Color scheme: Dominant {color_palette}, with accents of electric purple and holographic gold.
+Background: Dark void filled with subtle circuit patterns and ancient Chinese calligraphy floating like data code, {env_energy}{weather_influence}{direction_influence}.
+Style: Fusion of traditional Chinese fu-lu (符籙) talisman art with cyberpunk aesthetics.
+Text elements: Integrate the characters "{text_character}" in a stylized, glowing font.
+Quality: Masterpiece, trending on ArtStation, concept art, highly detailed, sharp focus, dramatic lighting."""
+
+
+@lru_cache(maxsize=256)
+def _palette_and_symbols(remedy_elements: Tuple[Element, ...]) -> Tuple[str, str]:
+    """Join the color palette and symbol phrases for an ordered remedy."""
+    if not remedy_elements:
+        return "mystical purple and gold", "ancient sigils"
+    visuals = [_ELEMENT_VISUALS[e] for e in remedy_elements]
+    return ", ".join(v[0] for v in visuals), ", ".join(v[1] for v in visuals)
+
+
+@lru_cache(maxsize=512)
+def _remedy_description(elements: Tuple[Element, ...]) -> str:
+    """Build the remedy guidance text for an ordered remedy."""
+    if not elements:
+        return "Maintain current balance through mindful awareness."
+
+    powers = [_ELEMENT_POWERS[e] for e in elements]
+    base = f"Channel {', '.join(powers)} to restore harmony."
+
+    # Add direction-specific advice based on REMEDY ELEMENTS (what user needs)
+    # Not based on current direction!
+    primary_remedy = elements[0]
+
+    # Direction advice should help user GET the remedy element
+    if primary_remedy in _REMEDY_DIRECTION_ADVICE:
+        base += f" {_REMEDY_DIRECTION_ADVICE[primary_remedy]}"
+
+    # Add Wu Xing generation cycle explanation if multiple remedy elements
+    if len(elements) >= 2:
+        cycle_explanations = []
+        for i in range(len(elements) - 1):
+            e1, e2 = elements[i], elements[i + 1]
+            if e1.generates == e2:
+                cycle_explanations.append(f"{e1.chinese}({e1.value.title()}) generates {e2.chinese}({e2.value.title()})")
+
+        if cycle_explanations:
+            base += f" Flow: {' → '.join(cycle_explanations)}."
+
+    return base
+
+
 class Alchemist:
     """
     The Brain of Qi-Link - Calculates metaphysical balance and
@@ -74,6 +238,16 @@ class Alchemist:
         (Element.EARTH, Element.METAL): {"en": "Earth depleted by Metal - giving structure drains resources", "zh": "土生金洩 - 付出結構耗損資源", "remedy": [Element.FIRE, Element.WATER]},
     }
 
+    # Nested view of IMBALANCE_MATRIX (user element -> environment element -> entry)
+    # so diagnose() does two plain lookups instead of building and hashing a tuple key.
+    # Descriptions are interned since they key the description cache.
+    IMBALANCE_BY_USER: Dict[Element, Dict[Element, dict]] = {element: {} for element in Element}
+    for (_user, _env), _entry in IMBALANCE_MATRIX.items():
+        _entry["en"] = sys.intern(_entry["en"])
+        _entry["zh"] = sys.intern(_entry["zh"])
+        IMBALANCE_BY_USER[_user][_env] = _entry
+    del _user, _env, _entry
+
     BALANCED_REMEDY = {"en": "Elements in harmony - maintain current flow", "zh": "五行調和 - 維持當前能量流動", "remedy": []}
 
     def __init__(self):
@@ -100,38 +274,57 @@ class Alchemist:
             Diagnosis with imbalance analysis and remedy prescription
         """
         user_element = fate.inherent_element
-        
-        # Calculate combined environmental element considering all factors
-        env_element = self._calculate_combined_environment_element(
-            environment, 
-            real_environment
-        )
-        
-        # Get additional modifiers from real environment
-        env_modifiers = self._analyze_real_environment(real_environment)
-        
-        key = (user_element, env_element)
-        imbalance_data = self.IMBALANCE_MATRIX.get(key)
 
-        if imbalance_data is None:
-            imbalance_data = self._find_weakness_remedy(fate, environment)
-        
-        # Adjust remedy based on environmental modifiers
-        remedy_elements = self._adjust_remedy_for_environment(
-            imbalance_data["remedy"].copy() if imbalance_data["remedy"] else [],
-            env_modifiers,
-            user_element
-        )
-        
+        if not real_environment:
+            # Fast path: with no weather or compass data both of those slots
+            # default to Earth (0.70 combined), which always outweighs the
+            # machine's 0.30, and every environment modifier stays neutral.
+            imbalance_data = self.IMBALANCE_BY_USER[user_element].get(Element.EARTH)
+            if imbalance_data is None:
+                imbalance_data = self._find_weakness_remedy(fate, environment)
+            remedy_elements = imbalance_data["remedy"][:3]
+            description_en = imbalance_data["en"]
+        else:
+            # Resolve weather and facing direction once; both helpers below share them
+            weather = self._extract_weather(real_environment)
+            direction_name, direction_element = self._resolve_direction(real_environment)
+
+            # Calculate combined environmental element considering all factors
+            env_element = self._calculate_combined_environment_element(
+                environment,
+                weather,
+                direction_element
+            )
+
+            # Get additional modifiers from real environment
+            env_modifiers = self._analyze_real_environment(
+                real_environment,
+                weather,
+                direction_name,
+                direction_element
+            )
+
+            imbalance_data = self.IMBALANCE_BY_USER[user_element].get(env_element)
+
+            if imbalance_data is None:
+                imbalance_data = self._find_weakness_remedy(fate, environment)
+
+            # Adjust remedy based on environmental modifiers
+            remedy_elements = self._adjust_remedy_for_environment(
+                imbalance_data["remedy"],
+                env_modifiers,
+                user_element
+            )
+
+            # Build enhanced description with real-world factors
+            description_en = self._build_enhanced_description(
+                imbalance_data["en"],
+                env_modifiers
+            )
+
         if not remedy_elements:
             remedy_elements = [self._get_generating_element(user_element)]
 
-        # Build enhanced description with real-world factors
-        description_en = self._build_enhanced_description(
-            imbalance_data["en"],
-            env_modifiers
-        )
-
         talisman_prompt = self._generate_talisman_prompt(
             fate, environment, remedy_elements, description_en, real_environment
         )
@@ -142,15 +335,41 @@ class Alchemist:
             imbalance_description=description_en,
             imbalance_description_chinese=imbalance_data["zh"],
             remedy_elements=remedy_elements,
-            remedy_description=self._generate_remedy_description(remedy_elements, env_modifiers),
+            remedy_description=self._generate_remedy_description(remedy_elements),
             talisman_prompt=talisman_prompt,
             talisman_style="Cyberpunk Taoist Talisman",
         )
 
+    @staticmethod
+    def _extract_weather(
+        real_env: Optional[Dict[str, Any]]
+    ) -> Optional[Tuple[float, int, Optional[str]]]:
+        """Return (temperature, humidity, condition) from weather data, if any."""
+        weather = real_env.get("weather") if real_env else None
+        if not weather:
+            return None
+        return (
+            getattr(weather, 'temperature_celsius', 20.0),
+            getattr(weather, 'humidity_percent', 50),
+            getattr(weather, 'weather_condition', None),
+        )
+
+    def _resolve_direction(
+        self,
+        real_env: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[str], Optional[Element]]:
+        """Return the facing direction name and its Ba Gua element, if known."""
+        compass = real_env.get("compass") if real_env else None
+        if not compass:
+            return None, None
+        direction_name = getattr(compass, 'cardinal_direction', None)
+        return direction_name, self.DIRECTION_ELEMENTS.get((direction_name or '').lower())
+
     def _calculate_combined_environment_element(
         self,
         machine_env: EnvironmentReading,
-        real_env: Optional[Dict[str, Any]]
+        weather: Optional[Tuple[float, int, Optional[str]]],
+        direction_element: Optional[Element]
     ) -> Element:
         """
         Calculate the dominant environmental element from all sources.
@@ -162,128 +381,110 @@ class Alchemist:
         
         Returns the element with highest combined score.
         """
-        element_scores: Dict[Element, float] = {e: 0.0 for e in Element}
+        scores = [0.0] * len(_ELEMENTS)
         
         # 1. Machine environment contribution (30%)
         machine_element = machine_env.dominant_environment_element
-        element_scores[machine_element] += 0.30
+        scores[_ELEMENT_INDEX[machine_element]] += 0.30
         
         # 2. Real ambient temperature contribution (35%)
-        if real_env and real_env.get("weather"):
-            weather = real_env["weather"]
-            temp = getattr(weather, 'temperature_celsius', 20.0)
-            humidity = getattr(weather, 'humidity_percent', 50)
+        if weather:
+            temp, humidity, _ = weather
             
             # Temperature -> Element
             if temp >= self.TEMP_FIRE_THRESHOLD:
-                element_scores[Element.FIRE] += 0.35
+                scores[_FIRE] += 0.35
             elif temp <= self.TEMP_WATER_THRESHOLD:
-                element_scores[Element.WATER] += 0.35
+                scores[_WATER] += 0.35
             elif temp > 20:
                 # Warm but not hot - mild Fire + Earth
-                element_scores[Element.FIRE] += 0.15
-                element_scores[Element.EARTH] += 0.20
+                scores[_FIRE] += 0.15
+                scores[_EARTH] += 0.20
             else:
                 # Cool but not cold - mild Water + Metal
-                element_scores[Element.WATER] += 0.15
-                element_scores[Element.METAL] += 0.20
+                scores[_WATER] += 0.15
+                scores[_METAL] += 0.20
             
             # Humidity modifier
             if humidity >= self.HUMIDITY_HIGH_THRESHOLD:
-                element_scores[Element.WATER] += 0.10
+                scores[_WATER] += 0.10
             elif humidity <= self.HUMIDITY_LOW_THRESHOLD:
-                element_scores[Element.FIRE] += 0.05
-                element_scores[Element.METAL] += 0.05
+                scores[_FIRE] += 0.05
+                scores[_METAL] += 0.05
         else:
             # No real weather data - distribute evenly
-            element_scores[Element.EARTH] += 0.35
+            scores[_EARTH] += 0.35
         
         # 3. Facing direction contribution (35%)
-        if real_env and real_env.get("compass"):
-            compass = real_env["compass"]
-            direction = getattr(compass, 'cardinal_direction', '').lower()
-            direction_element = self.DIRECTION_ELEMENTS.get(direction)
-            
-            if direction_element:
-                element_scores[direction_element] += 0.35
-            else:
-                # Unknown direction - default to Earth (stability)
-                element_scores[Element.EARTH] += 0.35
+        if direction_element:
+            scores[_ELEMENT_INDEX[direction_element]] += 0.35
         else:
-            # No compass data - distribute evenly
-            element_scores[Element.EARTH] += 0.35
-        
-        # Return element with highest score
-        return max(element_scores, key=element_scores.get)
+            # Unknown direction or no compass data - default to Earth (stability)
+            scores[_EARTH] += 0.35
+        
+        # Return element with highest score (first one wins ties)
+        best = 0
+        for i in range(1, len(scores)):
+            if scores[i] > scores[best]:
+                best = i
+        return _ELEMENTS[best]
 
     def _analyze_real_environment(
         self, 
-        real_env: Optional[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+        real_env: Optional[Dict[str, Any]],
+        weather: Optional[Tuple[float, int, Optional[str]]] = None,
+        direction_name: Optional[str] = None,
+        direction_element: Optional[Element] = None
+    ) -> EnvironmentModifiers:
         """
         Analyze real environment for additional modifiers.
         
-        Returns dict with:
-        - temperature_influence: 'hot', 'cold', 'moderate'
-        - humidity_influence: 'wet', 'dry', 'moderate'
-        - direction_element: Element from facing direction
-        - direction_name: Cardinal direction name
-        - weather_condition: Current weather
-        - location: City/region
+        Weather and facing direction are extracted once by the caller;
+        see EnvironmentModifiers for the returned fields.
         """
-        modifiers = {
-            "temperature_influence": "moderate",
-            "humidity_influence": "moderate",
-            "direction_element": None,
-            "direction_name": None,
-            "weather_condition": None,
-            "location": None,
-            "ambient_temp": None,
-        }
-        
         if not real_env:
-            return modifiers
+            return _NO_MODIFIERS
+        
+        temperature_influence = humidity_influence = "moderate"
+        ambient_temp = condition = None
         
         # Weather analysis
-        weather = real_env.get("weather")
         if weather:
-            temp = getattr(weather, 'temperature_celsius', 20.0)
-            humidity = getattr(weather, 'humidity_percent', 50)
+            ambient_temp, humidity, condition = weather
             
-            modifiers["ambient_temp"] = temp
-            modifiers["weather_condition"] = getattr(weather, 'weather_condition', None)
-            
-            if temp >= self.TEMP_FIRE_THRESHOLD:
-                modifiers["temperature_influence"] = "hot"
-            elif temp <= self.TEMP_WATER_THRESHOLD:
-                modifiers["temperature_influence"] = "cold"
+            if ambient_temp >= self.TEMP_FIRE_THRESHOLD:
+                temperature_influence = "hot"
+            elif ambient_temp <= self.TEMP_WATER_THRESHOLD:
+                temperature_influence = "cold"
             
             if humidity >= self.HUMIDITY_HIGH_THRESHOLD:
-                modifiers["humidity_influence"] = "wet"
+                humidity_influence = "wet"
             elif humidity <= self.HUMIDITY_LOW_THRESHOLD:
-                modifiers["humidity_influence"] = "dry"
-        
-        # Compass analysis
-        compass = real_env.get("compass")
-        if compass:
-            direction = getattr(compass, 'cardinal_direction', '').lower()
-            modifiers["direction_name"] = getattr(compass, 'cardinal_direction', None)
-            modifiers["direction_element"] = self.DIRECTION_ELEMENTS.get(direction)
+                humidity_influence = "dry"
         
         # Location
+        location_name = None
         location = real_env.get("location")
         if location:
             city = getattr(location, 'city', None)
             country = getattr(location, 'country', None)
             if city and city != "Unknown":
-                modifiers["location"] = f"{city}, {country}"
-        
-        return modifiers
+                location_name = f"{city}, {country}"
+        
+        return EnvironmentModifiers(
+            temperature_influence,
+            humidity_influence,
+            direction_element,
+            direction_name,
+            condition,
+            location_name,
+            ambient_temp,
+        )
 
     def _adjust_remedy_for_environment(
         self,
         base_remedy: list,
-        env_modifiers: Dict[str, Any],
+        env_modifiers: EnvironmentModifiers,
         user_element: Element
     ) -> list[Element]:
         """
@@ -294,41 +495,43 @@ class Alchemist:
         - High humidity: Reduce Water in remedy, add Earth (drainage)
         - Facing direction conflicts: Add generating element
         """
-        remedy = list(base_remedy) if base_remedy else []
+        # Always work on a fresh list - base_remedy is shared table data
+        remedy = list(base_remedy)
+        present = set(remedy)
+        
+        # Elements are only ever appended, so anything past the first three is
+        # dropped by the final slice - no per-append length guards needed.
         
         # Temperature adjustments
-        if env_modifiers["temperature_influence"] == "hot":
-            if Element.WATER not in remedy and Element.FIRE in remedy:
-                # Hot + Fire remedy = too much heat, add Water
+        if env_modifiers.temperature_influence == "hot":
+            # Add cooling Water - always with a Fire remedy (too much heat),
+            # otherwise unless the user is a Fire type
+            if Element.WATER not in present and (Element.FIRE in present or user_element != Element.FIRE):
                 remedy.append(Element.WATER)
-            elif Element.WATER not in remedy:
-                # Hot environment, consider adding cooling Water
-                if user_element != Element.FIRE:  # Unless user is Fire type
-                    remedy.append(Element.WATER)
+                present.add(Element.WATER)
         
-        elif env_modifiers["temperature_influence"] == "cold":
-            if Element.FIRE not in remedy and Element.WATER in remedy:
-                # Cold + Water remedy = too cold, add Fire
+        elif env_modifiers.temperature_influence == "cold":
+            # Add warming Fire - always with a Water remedy (too cold),
+            # otherwise unless the user is a Water type
+            if Element.FIRE not in present and (Element.WATER in present or user_element != Element.WATER):
                 remedy.append(Element.FIRE)
-            elif Element.FIRE not in remedy:
-                # Cold environment, consider adding warming Fire
-                if user_element != Element.WATER:  # Unless user is Water type
-                    remedy.append(Element.FIRE)
+                present.add(Element.FIRE)
         
         # Humidity adjustments
-        if env_modifiers["humidity_influence"] == "wet":
+        if env_modifiers.humidity_influence == "wet":
             # High humidity - Earth helps absorb excess Water
-            if Element.EARTH not in remedy and len(remedy) < 3:
+            if Element.EARTH not in present:
                 remedy.append(Element.EARTH)
+                present.add(Element.EARTH)
         
         # Direction element conflict resolution
-        direction_element = env_modifiers.get("direction_element")
+        direction_element = env_modifiers.direction_element
         if direction_element:
             # If facing a direction that conflicts with user element
             if direction_element.controls == user_element:
                 # Add generating element to protect user
                 protector = self._get_generating_element(user_element)
-                if protector not in remedy and len(remedy) < 3:
+                if protector not in present:
                     remedy.append(protector)
         
         # Limit to max 3 remedy elements
@@ -337,36 +540,18 @@ class Alchemist:
     def _build_enhanced_description(
         self,
         base_description: str,
-        env_modifiers: Dict[str, Any]
+        env_modifiers: EnvironmentModifiers
     ) -> str:
         """Build enhanced description including real-world factors."""
-        parts = [base_description]
-        
-        # Add temperature influence
-        if env_modifiers["temperature_influence"] == "hot":
-            temp = env_modifiers.get("ambient_temp", 30)
-            parts.append(f"Hot environment ({temp:.0f}C) intensifies Fire energy.")
-        elif env_modifiers["temperature_influence"] == "cold":
-            temp = env_modifiers.get("ambient_temp", 10)
-            parts.append(f"Cold environment ({temp:.0f}C) amplifies Water energy.")
-        
-        # Add direction influence
-        if env_modifiers["direction_name"] and env_modifiers["direction_element"]:
-            direction = env_modifiers["direction_name"]
-            element = env_modifiers["direction_element"]
-            parts.append(f"Facing {direction} channels {element.value.title()} energy.")
-        
-        # Add weather condition
-        if env_modifiers["weather_condition"]:
-            condition = env_modifiers["weather_condition"]
-            if "rain" in condition.lower():
-                parts.append("Rain enhances Water element influence.")
-            elif "clear" in condition.lower() or "sunny" in condition.lower():
-                parts.append("Clear skies strengthen Fire/Metal clarity.")
-            elif "cloud" in condition.lower():
-                parts.append("Cloudy conditions moderate elemental extremes.")
-        
-        return " ".join(parts)
+        ambient_temp = env_modifiers.ambient_temp
+        return _enhanced_description(
+            base_description,
+            env_modifiers.temperature_influence,
+            round(ambient_temp) if ambient_temp is not None else None,
+            env_modifiers.direction_name,
+            env_modifiers.direction_element,
+            _classify_weather(env_modifiers.weather_condition),
+        )
 
     def _find_weakness_remedy(self, fate: FateProfile, environment: EnvironmentReading) -> dict:
         weakest = fate.weakest_element
@@ -377,62 +562,11 @@ class Alchemist:
         }
 
     def _get_generating_element(self, element: Element) -> Element:
-        generation_cycle = {
-            Element.METAL: Element.EARTH,
-            Element.WATER: Element.METAL,
-            Element.WOOD: Element.WATER,
-            Element.FIRE: Element.WOOD,
-            Element.EARTH: Element.FIRE,
-        }
-        return generation_cycle[element]
+        return element.generated_by
 
-    def _generate_remedy_description(
-        self, 
-        elements: list[Element],
-        env_modifiers: Optional[Dict[str, Any]] = None
-    ) -> str:
-        if not elements:
-            return "Maintain current balance through mindful awareness."
-        
-        element_powers = {
-            Element.METAL: "clarity and structure",
-            Element.WOOD: "growth and flexibility",
-            Element.WATER: "wisdom and adaptability",
-            Element.FIRE: "passion and transformation",
-            Element.EARTH: "stability and grounding",
-        }
-        powers = [element_powers[e] for e in elements]
-        base = f"Channel {', '.join(powers)} to restore harmony."
-        
-        # Add direction-specific advice based on REMEDY ELEMENTS (what user needs)
-        # Not based on current direction!
-        primary_remedy = elements[0] if elements else None
-        
-        if primary_remedy:
-            # Direction advice should help user GET the remedy element
-            remedy_direction_advice = {
-                Element.FIRE: "Face South to harness Fire energy, or add Wood (green plants, growth activities) as a bridge - Water generates Wood, Wood generates Fire.",
-                Element.WATER: "Face North to channel Water wisdom, or embrace Metal (white, clarity, structure) which generates Water.",
-                Element.WOOD: "Face East to absorb Wood's growth energy, or connect with Water (meditation, flow) which nourishes Wood.",
-                Element.METAL: "Face West to receive Metal's clarity, or cultivate Earth (stability, grounding) which generates Metal.",
-                Element.EARTH: "Face Southwest or Northeast for Earth grounding, or kindle Fire (passion, action) which creates Earth.",
-            }
-            
-            if primary_remedy in remedy_direction_advice:
-                base += f" {remedy_direction_advice[primary_remedy]}"
-        
-        # Add Wu Xing generation cycle explanation if multiple remedy elements
-        if len(elements) >= 2:
-            cycle_explanations = []
-            for i in range(len(elements) - 1):
-                e1, e2 = elements[i], elements[i + 1]
-                if e1.generates == e2:
-                    cycle_explanations.append(f"{e1.chinese}({e1.value.title()}) generates {e2.chinese}({e2.value.title()})")
-            
-            if cycle_explanations:
-                base += f" Flow: {' → '.join(cycle_explanations)}."
-        
-        return base
+    def _generate_remedy_description(self, elements: list[Element]) -> str:
+        """Describe the remedy; the text depends only on the remedy elements."""
+        return _remedy_description(tuple(elements))
 
     def _generate_talisman_prompt(
         self, 
@@ -442,23 +576,7 @@ class Alchemist:
         imbalance_en: str,
         real_environment: Optional[Dict[str, Any]] = None
     ) -> str:
-        star_name = fate.major_star.value
-        element_visuals = {
-            Element.METAL: ("silver and white", "geometric patterns, crystals, circuits"),
-            Element.WOOD: ("emerald green and cyan", "bamboo, vines, digital roots"),
-            Element.FIRE: ("crimson and orange", "flames, phoenixes, plasma arcs"),
-            Element.WATER: ("deep blue and aqua", "waves, dragons, data streams"),
-            Element.EARTH: ("golden amber and brown", "mountains, hexagons, solid foundations"),
-        }
-
-        colors, symbols = [], []
-        for elem in remedy_elements:
-            c, s = element_visuals[elem]
-            colors.append(c)
-            symbols.append(s)
-
-        color_palette = ", ".join(colors) if colors else "mystical purple and gold"
-        symbol_elements = ", ".join(symbols) if symbols else "ancient sigils"
+        color_palette, symbol_elements = _palette_and_symbols(tuple(remedy_elements))
 
         # Environment energy description
         if environment.temperature_state == EnergyState.EXCESS:
@@ -477,26 +595,23 @@ class Alchemist:
             compass = real_environment.get("compass")
             
             if weather:
-                condition = getattr(weather, 'weather_condition', '')
-                if "rain" in condition.lower():
-                    weather_influence = ", with mystical rain drops falling through the digital void"
-                elif "cloud" in condition.lower():
-                    weather_influence = ", with ethereal clouds of data mist"
-                elif "clear" in condition.lower():
-                    weather_influence = ", under a clear digital sky with stars"
+                condition = _classify_weather(getattr(weather, 'weather_condition', ''))
+                weather_influence = _WEATHER_PROMPTS.get(condition, "")
             
             if compass:
                 direction = getattr(compass, 'cardinal_direction', '')
                 if direction:
                     direction_influence = f", oriented towards the {direction} with corresponding Ba Gua trigram symbols"
 
-        return f"""A mystical cyberpunk Taoist talisman, hyper-detailed digital art, 8K resolution.
-Central motif: The {star_name} constellation rendered as a glowing neon sigil, surrounded by {symbol_elements}.
-Color scheme: Dominant {color_palette}, with accents of electric purple and holographic gold.
-Background: Dark void filled with subtle circuit patterns and ancient Chinese calligraphy floating like data code, {env_energy}{weather_influence}{direction_influence}.
-Style: Fusion of traditional Chinese fu-lu (符籙) talisman art with cyberpunk aesthetics.
-Text elements: Integrate the characters "{remedy_elements[0].chinese if remedy_elements else '氣'}" in a stylized, glowing font.
-Quality: Masterpiece, trending on ArtStation, concept art, highly detailed, sharp focus, dramatic lighting."""
+        return _TALISMAN_PROMPT_TEMPLATE.format(
+            star_name=fate.major_star.value,
+            symbol_elements=symbol_elements,
+            color_palette=color_palette,
+            env_energy=env_energy,
+            weather_influence=weather_influence,
+            direction_influence=direction_influence,
+            text_character=remedy_elements[0].chinese if remedy_elements else '氣',
+        )
 
     def get_element_relationship(self, element1: Element, element2: Element) -> str:
         if element1.generates == element2:
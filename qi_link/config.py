@@ -6,8 +6,8 @@ Centralized configuration using Pydantic Settings for type-safe
 environment variable management.
 """
 
-from functools import lru_cache
-from typing import Literal
+from functools import cached_property, lru_cache
+from typing import Literal, Optional
 
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -52,6 +52,13 @@ class QiLinkSettings(BaseSettings):
         description="Ping timeout in seconds",
     )
 
+    # Sensor Configuration
+    scan_cache_ttl: float = Field(
+        default=0.25,
+        ge=0,
+        description="Seconds a sensor scan is reused for rapid polls (0 disables)",
+    )
+
     # Application Mode
     mock_mode: bool = Field(
         default=True,
@@ -62,6 +69,12 @@ class QiLinkSettings(BaseSettings):
         description="Enable debug logging",
     )
 
+    # Calculation Cache
+    lunar_cache_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file persisting lunar conversions across restarts (disabled when unset)",
+    )
+
     # UI Configuration
     app_title: str = Field(
         default="氣鏈 Qi-Link",
@@ -72,9 +85,9 @@ class QiLinkSettings(BaseSettings):
         description="Application subtitle",
     )
 
-    @property
+    @cached_property
     def has_openai_key(self) -> bool:
-        """Check if a valid OpenAI API key is configured."""
+        """Check if a valid OpenAI API key is configured (evaluated once)."""
         key = self.openai_api_key.get_secret_value()
         return bool(key and key.startswith("sk-"))
 
@@ -8,72 +8,83 @@ of existence for talisman metadata.
 
 import json
 import secrets
+import threading
 import time
 from datetime import datetime
 from typing import Optional
 
-from web3 import Web3
+from Crypto.Hash import keccak
 
 from qi_link.exceptions import HashingError
-from qi_link.models import Diagnosis, TalismanMetadata
+from qi_link.models import Diagnosis, Element, TalismanMetadata
+
+
+# Enum member -> serialized value, skipping the Enum .value descriptor per access
+_ELEMENT_VALUES = {e: e.value for e in Element}
 
 
 class EtherLink:
     """Web3 interface for simulating on-chain operations."""
 
-    def __init__(self):
-        self._web3 = Web3()
-        self._mock_block_number = self._generate_mock_block_number()
+    # Mock chain head shared by every instance; seeded lazily, advanced once per mint
+    _block_number: int = 0
+    _block_lock = threading.Lock()
 
     def create_talisman_metadata(self, diagnosis: Diagnosis, image_url: str, location_ip: Optional[str] = None, location_region: Optional[str] = None) -> TalismanMetadata:
-        token_id = self._generate_token_id()
-        metadata = TalismanMetadata(
-            token_id=token_id,
-            created_at=datetime.now(),
-            location_ip=location_ip or self._get_mock_ip(),
-            location_region=location_region or "Cyber Realm",
-            diagnosis=diagnosis,
-            image_url=image_url,
-            metadata_hash="0" * 64,
-            block_number=self._mock_block_number,
-            chain_id=1,
-        )
-        metadata_hash = self.hash_metadata(metadata)
+        # One clock read per mint: the token id and created_at share it
+        now_ns = time.time_ns()
+        token_id = self._generate_token_id(now_ns)
+        created_at = datetime.fromtimestamp(now_ns / 1e9)
+        location_ip = location_ip or self._get_mock_ip()
+        location_region = location_region or "Cyber Realm"
+        metadata_hash = self._hash_fields(token_id, created_at, location_ip, location_region, diagnosis, image_url)
         return TalismanMetadata(
             token_id=token_id,
-            created_at=metadata.created_at,
-            location_ip=metadata.location_ip,
-            location_region=metadata.location_region,
+            created_at=created_at,
+            location_ip=location_ip,
+            location_region=location_region,
             diagnosis=diagnosis,
             image_url=image_url,
             metadata_hash=metadata_hash,
-            block_number=self._mock_block_number,
+            block_number=self._next_block_number(),
             chain_id=1,
         )
 
     def hash_metadata(self, metadata: TalismanMetadata) -> str:
+        return self._hash_fields(
+            metadata.token_id,
+            metadata.created_at,
+            metadata.location_ip,
+            metadata.location_region,
+            metadata.diagnosis,
+            metadata.image_url,
+        )
+
+    @staticmethod
+    def _hash_fields(token_id: str, created_at: datetime, location_ip: str, location_region: str, diagnosis: Diagnosis, image_url: str) -> str:
         try:
+            # Keys are inserted in sorted order at every level, so json.dumps
+            # emits the canonical key order without sort_keys
             hashable_data = {
-                "token_id": metadata.token_id,
-                "timestamp": metadata.created_at.isoformat(),
-                "location": {"ip": metadata.location_ip, "region": metadata.location_region},
                 "diagnosis": {
-                    "birth_datetime": metadata.diagnosis.fate_profile.birth_datetime.isoformat(),
-                    "major_star": metadata.diagnosis.fate_profile.major_star.value,
-                    "inherent_element": metadata.diagnosis.fate_profile.inherent_element.value,
-                    "environment_element": metadata.diagnosis.environment.dominant_environment_element.value,
-                    "cpu_temp": metadata.diagnosis.environment.cpu_temperature,
-                    "network_latency": metadata.diagnosis.environment.network_latency_ms,
-                    "entropy_hash": metadata.diagnosis.environment.entropy_hash,
-                    "remedy_elements": [e.value for e in metadata.diagnosis.remedy_elements],
+                    "birth_datetime": diagnosis.fate_profile.birth_datetime.isoformat(),
+                    "cpu_temp": diagnosis.environment.cpu_temperature,
+                    "entropy_hash": diagnosis.environment.entropy_hash,
+                    "environment_element": _ELEMENT_VALUES[diagnosis.environment.dominant_environment_element],
+                    "inherent_element": _ELEMENT_VALUES[diagnosis.fate_profile.inherent_element],
+                    "major_star": diagnosis.fate_profile.major_star.value,
+                    "network_latency": diagnosis.environment.network_latency_ms,
+                    "remedy_elements": [_ELEMENT_VALUES[e] for e in diagnosis.remedy_elements],
                 },
-                "image_url": metadata.image_url,
+                "image_url": image_url,
+                "location": {"ip": location_ip, "region": location_region},
+                "timestamp": created_at.isoformat(),
+                "token_id": token_id,
             }
-            json_str = json.dumps(hashable_data, sort_keys=True, separators=(",", ":"))
-            hash_bytes = self._web3.keccak(text=json_str)
-            return hash_bytes.hex()
+            json_str = json.dumps(hashable_data, separators=(",", ":"))
+            return keccak.new(data=json_str.encode("utf-8"), digest_bits=256).hexdigest()
         except Exception as e:
-            raise HashingError(message=f"Failed to hash metadata: {str(e)}", details={"token_id": metadata.token_id})
+            raise HashingError(message=f"Failed to hash metadata: {str(e)}", details={"token_id": token_id})
 
     def generate_nft_json(self, metadata: TalismanMetadata) -> dict:
         return {
@@ -91,20 +102,32 @@ class EtherLink:
             },
         }
 
-    def _generate_token_id(self) -> str:
-        timestamp_hex = hex(int(time.time() * 1000))[2:]
-        random_hex = secrets.token_hex(16)
-        return f"{timestamp_hex}-{random_hex}"
+    def generate_nft_bytes(self, metadata: TalismanMetadata) -> bytes:
+        """Serialize the NFT JSON as UTF-8 bytes, ready for download or upload."""
+        return json.dumps(self.generate_nft_json(metadata), indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _generate_token_id(self, now_ns: Optional[int] = None) -> str:
+        if now_ns is None:
+            now_ns = time.time_ns()
+        return f"{now_ns // 1_000_000:x}-{secrets.token_hex(16)}"
+
+    @classmethod
+    def _next_block_number(cls) -> int:
+        with cls._block_lock:
+            if not cls._block_number:
+                cls._block_number = cls._generate_mock_block_number()
+            cls._block_number += 1
+            return cls._block_number
 
-    def _generate_mock_block_number(self) -> int:
+    @staticmethod
+    def _generate_mock_block_number() -> int:
         base_block = 19_000_000
         days_elapsed = (time.time() - 1704067200) / 86400
         return base_block + int(days_elapsed * 7200) + secrets.randbelow(100)
 
     def _get_mock_ip(self) -> str:
-        octets = [(hash(str(time.time_ns())) >> i) & 255 for i in range(0, 32, 8)]
-        octets[0] = max(1, min(223, octets[0]))
-        return ".".join(str(o) for o in octets)
+        octets = secrets.token_bytes(4)
+        return f"{max(1, min(223, octets[0]))}.{octets[1]}.{octets[2]}.{octets[3]}"
 
     def _generate_description(self, metadata: TalismanMetadata) -> str:
         fate = metadata.diagnosis.fate_profile
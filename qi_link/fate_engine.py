@@ -14,14 +14,114 @@ Key Algorithm:
 """
 
 from datetime import datetime
-from typing import Optional, List, Tuple, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Iterable, List, Mapping, Tuple, Dict
 
 from lunar_python import Lunar, Solar
 
+from qi_link import lunar_cache
 from qi_link.exceptions import CalendarConversionError, InvalidBirthDataError
 from qi_link.models import Element, FateProfile, MajorStar
 
 
+def _build_zi_wei_table() -> Tuple[Tuple[int, ...], ...]:
+    """
+    Build Zi Wei placement table using 倪師公式.
+    
+    算法邏輯:
+    1. quotient = day // bureau
+    2. remainder = day % bureau
+    3. 如果整除 (remainder == 0):
+       - 位置 = 寅(3) + quotient - 1 (1-based)
+    4. 如果不整除:
+       - add_on = bureau - remainder (需要補多少)
+       - new_quotient = quotient + 1
+       - base_position = 寅(3) + new_quotient - 1
+       - 核心口訣：商數起宮，單數順數，雙數逆數
+       - 如果 new_quotient 是奇數: 順數 (加) add_on
+       - 如果 new_quotient 是偶數: 逆數 (減) add_on
+    
+    Returns rows indexed by bureau (0-6) and columns by lunar day (0-30);
+    rows 0-1 and day 0 are unused and hold the default 寅 (2).
+    """
+    YIN = 3  # 寅 = 3 (1-based)
+    table = [[2] * 31 for _ in range(7)]
+    
+    # Branch-free form of the steps above: new_quotient is ceil(day / bureau),
+    # add_on is 0 when 整除 (so the sign no longer matters), and the sign is
+    # +1 for 單數 / -1 for 雙數.
+    for bureau in [2, 3, 4, 5, 6]:
+        for day in range(1, 31):
+            new_quotient = -(-day // bureau)
+            add_on = new_quotient * bureau - day
+            sign = 2 * (new_quotient & 1) - 1
+            # 1-based 位置 = 寅 + new_quotient - 1 + sign * add_on; 轉換到 0-based (子=0)
+            table[bureau][day] = (YIN + new_quotient - 2 + sign * add_on) % 12
+    
+    return tuple(tuple(row) for row in table)
+
+
+# Built once at import; pure function of (局數, 農曆日)
+_ZI_WEI_TABLE = _build_zi_wei_table()
+
+
+class _ReadOnlyDict(dict):
+    """
+    dict that rejects mutation, for data shared through the fate cache.
+
+    A dict subclass rather than MappingProxyType so pydantic can still
+    serialize FateProfile (it rejects mappingproxy values).
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("cached fate data is read-only; copy it with dict() first")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # copy/deepcopy/pickle rebuild from a plain dict instead of item assignment
+        return type(self), (dict(self),)
+
+
+_EMPTY_READ_ONLY = _ReadOnlyDict()
+
+
+@lru_cache(maxsize=4096)
+def _lunar_decompose(
+    year: int, month: int, day: int, hour: int, minute: int, second: int
+) -> Tuple[str, str, str, str, int, int, int]:
+    """
+    Convert a solar time to its 八字 pillars and lunar date.
+
+    Returns (年柱, 月柱, 日柱, 時柱, 農曆年, 農曆月, 農曆日) as plain values so the
+    cache holds no lunar_python objects. 農曆月 is made positive (閏月 are
+    negative in lunar_python). Shared by all FateEngine instances, and
+    backed by the optional on-disk lunar_cache across restarts.
+    """
+    key = f"{year}-{month}-{day}-{hour}-{minute}-{second}"
+    stored = lunar_cache.load(key)
+    if stored is not None:
+        return stored
+
+    lunar = Solar(year, month, day, hour, minute, second).getLunar()
+    eight_char = lunar.getEightChar()
+    result = (
+        eight_char.getYear(),
+        eight_char.getMonth(),
+        eight_char.getDay(),
+        eight_char.getTime(),
+        lunar.getYear(),
+        abs(lunar.getMonth()),
+        lunar.getDay(),
+    )
+    lunar_cache.save(key, result)
+    return result
+
+
 class FateEngine:
     """
     Accurate Zi Wei Dou Shu calculation engine.
@@ -38,6 +138,9 @@ class FateEngine:
     # 地支名稱 (0-indexed)
     BRANCHES = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
     
+    # 24-hour clock -> 時辰 index (0=子, 1=丑, ...); 23:00 starts the next 子時
+    HOUR_TO_BRANCH = tuple(((hour + 1) // 2) % 12 for hour in range(24))
+    
     # 天干名稱
     STEMS = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
     
@@ -87,13 +190,27 @@ class FateEngine:
         "癸午": 5, "癸未": 5, "癸申": 2, "癸酉": 2, "癸戌": 6, "癸亥": 6,
     }
     
+    # 天干索引
+    STEM_INDEX = {stem: i for i, stem in enumerate(STEMS)}
+
+    # WU_XING_JU as WU_XING_JU_TABLE[年干索引][命宮地支索引] -> 局數, so
+    # calculate_fate does two tuple loads instead of building a string key
+    WU_XING_JU_TABLE = []
+    for _stem in STEMS:
+        _row = []
+        for _branch in BRANCHES:
+            _row.append(WU_XING_JU[_stem + _branch])
+        WU_XING_JU_TABLE.append(tuple(_row))
+    WU_XING_JU_TABLE = tuple(WU_XING_JU_TABLE)
+    del _stem, _branch, _row
+    
     # 局名
     JU_NAMES = {2: "水二局", 3: "木三局", 4: "金四局", 5: "土五局", 6: "火六局"}
 
     # 紫微星安星表 (倪師終極版)
-    # Key: (局數, 農曆日) -> 紫微所在地支 (0-indexed: 子=0...亥=11)
+    # ZI_WEI_TABLE[局數][農曆日] -> 紫微所在地支 (0-indexed: 子=0...亥=11)
     # 這是根據傳統安星訣整理的完整表
-    ZI_WEI_TABLE = {}
+    ZI_WEI_TABLE = _ZI_WEI_TABLE
     
     # 四化表
     SI_HUA = {
@@ -108,57 +225,8 @@ class FateEngine:
         "壬": {"化祿": "天梁", "化權": "紫微", "化科": "左輔", "化忌": "武曲"},
         "癸": {"化祿": "破軍", "化權": "巨門", "化科": "太陰", "化忌": "貪狼"},
     }
-
-    def __init__(self):
-        """Initialize with complete Zi Wei lookup table."""
-        self._build_zi_wei_table()
-
-    def _build_zi_wei_table(self):
-        """
-        Build Zi Wei placement table using 倪師公式.
-        
-        算法邏輯:
-        1. quotient = day // bureau
-        2. remainder = day % bureau
-        3. 如果整除 (remainder == 0):
-           - 位置 = 寅(3) + quotient - 1 (1-based)
-        4. 如果不整除:
-           - add_on = bureau - remainder (需要補多少)
-           - new_quotient = quotient + 1
-           - base_position = 寅(3) + new_quotient - 1
-           - 核心口訣：商數起宮，單數順數，雙數逆數
-           - 如果 new_quotient 是奇數: 順數 (加) add_on
-           - 如果 new_quotient 是偶數: 逆數 (減) add_on
-        """
-        YIN = 3  # 寅 = 3 (1-based)
-        
-        for bureau in [2, 3, 4, 5, 6]:
-            for day in range(1, 31):
-                quotient = day // bureau
-                remainder = day % bureau
-                
-                if remainder == 0:
-                    # 整除：從寅順數 quotient 位
-                    position_1based = YIN + quotient - 1
-                else:
-                    # 不整除：需要補數
-                    add_on = bureau - remainder
-                    new_quotient = quotient + 1
-                    
-                    # 基礎位置
-                    base_position = YIN + new_quotient - 1
-                    
-                    # 核心口訣：商數起宮，單數順數，雙數逆數
-                    if new_quotient % 2 == 1:  # 奇數 (單數): 順數
-                        position_1based = base_position + add_on
-                    else:  # 偶數 (雙數): 逆數
-                        position_1based = base_position - add_on
-                
-                # 轉換到 0-based (子=0, 丑=1, ..., 亥=11)
-                # 1-based: 子=1, 丑=2, ..., 亥=12
-                position_0based = (position_1based - 1) % 12
-                
-                self.ZI_WEI_TABLE[(bureau, day)] = position_0based
+    # Handed out inside cached profiles, so every entry is read-only
+    SI_HUA = MappingProxyType({stem: _ReadOnlyDict(hua) for stem, hua in SI_HUA.items()})
 
     def get_zi_wei_location(self, lunar_day: int, bureau: int) -> int:
         """
@@ -171,8 +239,9 @@ class FateEngine:
         Returns:
             地支索引 (0=子, 1=丑, 2=寅, ...)
         """
-        day = min(max(lunar_day, 1), 30)
-        return self.ZI_WEI_TABLE.get((bureau, day), 2)
+        if not 2 <= bureau <= 6:
+            return 2
+        return self.ZI_WEI_TABLE[bureau][min(max(lunar_day, 1), 30)]
 
     # 紫微天府對照表 (標準安星法)
     # 紫府同宮只在寅(2)和申(8)！
@@ -207,34 +276,40 @@ class FateEngine:
         """
         return self.TIAN_FU_MAP.get(zi_wei_idx, 4)
 
-    def place_all_stars(self, zi_wei_idx: int, tian_fu_idx: int) -> Dict[str, int]:
+    # 十四主星 in placement order (紫微系 then 天府系); a star's index here is
+    # its integer id inside calculate_fate, matching MajorStar's member order
+    STARS = tuple(MajorStar)
+    STAR_NAMES = tuple(star.value for star in STARS)
+    # 命宮主星排序 (按重要性): star name -> rank
+    STAR_PRIORITY = {
+        star: rank for rank, star in enumerate(
+            ["紫微", "天府", "武曲", "貪狼", "天機", "太陽", "太陰",
+             "天同", "廉貞", "巨門", "天相", "天梁", "七殺", "破軍"]
+        )
+    }
+    # Priority rank by star id
+    STAR_RANKS = tuple(map(STAR_PRIORITY.__getitem__, STAR_NAMES))
+    # Star ids from most to least important, so filtering keeps priority order
+    STAR_IDS_BY_PRIORITY = tuple(sorted(range(len(STAR_NAMES)), key=STAR_RANKS.__getitem__))
+    # 紫微系 (逆時針) offsets from 紫微, 天府系 (順時針) offsets from 天府
+    ZI_WEI_OFFSETS = (0, -1, -3, -4, -5, -8)
+    TIAN_FU_OFFSETS = (0, 1, 2, 3, 4, 5, 6, 10)
+
+    def place_star_indices(self, zi_wei_idx: int, tian_fu_idx: int) -> Tuple[int, ...]:
         """
-        安放所有14顆主星.
+        安放所有14顆主星, returning positions in STAR_NAMES order.
         
         紫微系 (逆時針): 紫微, 天機(-1), 太陽(-3), 武曲(-4), 天同(-5), 廉貞(-8)
         天府系 (順時針): 天府, 太陰(+1), 貪狼(+2), 巨門(+3), 天相(+4), 天梁(+5), 七殺(+6), 破軍(+10)
         """
-        positions = {}
-        
-        # 紫微系 (逆時針分布)
-        positions["紫微"] = zi_wei_idx
-        positions["天機"] = (zi_wei_idx - 1) % 12
-        positions["太陽"] = (zi_wei_idx - 3) % 12
-        positions["武曲"] = (zi_wei_idx - 4) % 12
-        positions["天同"] = (zi_wei_idx - 5) % 12
-        positions["廉貞"] = (zi_wei_idx - 8) % 12
-        
-        # 天府系 (順時針分布)
-        positions["天府"] = tian_fu_idx
-        positions["太陰"] = (tian_fu_idx + 1) % 12
-        positions["貪狼"] = (tian_fu_idx + 2) % 12
-        positions["巨門"] = (tian_fu_idx + 3) % 12
-        positions["天相"] = (tian_fu_idx + 4) % 12
-        positions["天梁"] = (tian_fu_idx + 5) % 12
-        positions["七殺"] = (tian_fu_idx + 6) % 12
-        positions["破軍"] = (tian_fu_idx + 10) % 12
-        
-        return positions
+        return tuple(
+            [(zi_wei_idx + offset) % 12 for offset in self.ZI_WEI_OFFSETS]
+            + [(tian_fu_idx + offset) % 12 for offset in self.TIAN_FU_OFFSETS]
+        )
+
+    def place_all_stars(self, zi_wei_idx: int, tian_fu_idx: int) -> Dict[str, int]:
+        """安放所有14顆主星, keyed by star name (see place_star_indices)."""
+        return dict(zip(self.STAR_NAMES, self.place_star_indices(zi_wei_idx, tian_fu_idx)))
 
     def get_life_palace_branch(self, lunar_month: int, hour_idx: int) -> int:
         """
@@ -259,37 +334,54 @@ class FateEngine:
         return life_palace
 
     def calculate_fate(self, birth_datetime: datetime) -> FateProfile:
-        """Calculate complete fate profile."""
+        """
+        Calculate complete fate profile.
+
+        Results are memoized per birth datetime, so the returned profile is
+        shared between callers; its dicts are read-only and its lists tuples.
+        """
         self._validate_birth_datetime(birth_datetime)
+        return _cached_fate(birth_datetime)
+
+    def calculate_fate_batch(self, birth_datetimes: Iterable[datetime]) -> List[FateProfile]:
+        """
+        Calculate fate profiles for many birth datetimes, in input order.
 
+        The clock is read once for the whole batch, and repeated datetimes
+        share one calculation through the memo cache.
+        """
+        now = datetime.now()
+        validate, cached_fate = self._validate_birth_datetime, _cached_fate
+        profiles = []
+        for birth_datetime in birth_datetimes:
+            validate(birth_datetime, now)
+            profiles.append(cached_fate(birth_datetime))
+        return profiles
+
+    def _compute_fate(self, birth_datetime: datetime) -> FateProfile:
+        """Run the full calculation for an already validated birth datetime."""
         try:
-            # 1. 農曆轉換
-            solar = Solar.fromDate(birth_datetime)
-            lunar = solar.getLunar()
-            eight_char = lunar.getEightChar()
-
-            # 2. 八字
-            year_pillar = eight_char.getYear()
-            month_pillar = eight_char.getMonth()
-            day_pillar = eight_char.getDay()
-            hour_pillar = eight_char.getTime()
+            # 1-3. 農曆轉換, 八字, 農曆年月日
+            (
+                year_pillar, month_pillar, day_pillar, hour_pillar,
+                lunar_year, lunar_month, lunar_day,
+            ) = _lunar_decompose(
+                birth_datetime.year, birth_datetime.month, birth_datetime.day,
+                birth_datetime.hour, birth_datetime.minute, birth_datetime.second,
+            )
             
             year_stem = year_pillar[0] if year_pillar else "甲"
             
-            # 3. 農曆日月
-            lunar_month = abs(lunar.getMonth())
-            lunar_day = lunar.getDay()
-            
             # 4. 時辰索引
-            hour_idx = self._get_hour_index(birth_datetime.hour)
+            hour_idx = self.HOUR_TO_BRANCH[birth_datetime.hour]
             
             # 5. 命宮地支
             life_palace_idx = self.get_life_palace_branch(lunar_month, hour_idx)
             life_palace_branch = self.BRANCHES[life_palace_idx]
             
             # 6. 五行局
-            ju_key = year_stem + life_palace_branch
-            bureau = self.WU_XING_JU.get(ju_key, 3)
+            stem_idx = self.STEM_INDEX.get(year_stem)
+            bureau = 3 if stem_idx is None else self.WU_XING_JU_TABLE[stem_idx][life_palace_idx]
             ju_name = self.JU_NAMES.get(bureau, "木三局")
             
             # 7. 紫微位置
@@ -299,30 +391,25 @@ class FateEngine:
             tian_fu_idx = self.get_tian_fu_location(zi_wei_idx)
             
             # 9. 安放所有星
-            star_positions = self.place_all_stars(zi_wei_idx, tian_fu_idx)
+            star_positions = self.place_star_indices(zi_wei_idx, tian_fu_idx)
             
-            # 10. 命宮主星
-            stars_in_life_palace = [
-                star for star, pos in star_positions.items() 
-                if pos == life_palace_idx
+            # 10. 命宮主星 (integer star ids until names are needed), already
+            # 按重要性排序 since the scan walks ids in priority order
+            life_star_ids = [
+                star_id for star_id in self.STAR_IDS_BY_PRIORITY
+                if star_positions[star_id] == life_palace_idx
             ]
-            
-            # 排序 (按重要性)
-            star_priority = ["紫微", "天府", "武曲", "貪狼", "天機", "太陽", "太陰", 
-                           "天同", "廉貞", "巨門", "天相", "天梁", "七殺", "破軍"]
-            stars_in_life_palace.sort(
-                key=lambda s: star_priority.index(s) if s in star_priority else 99
-            )
+            stars_in_life_palace = tuple([self.STAR_NAMES[star_id] for star_id in life_star_ids])
             
             # 11. 四化
-            si_hua = self.SI_HUA.get(year_stem, {})
+            si_hua = self.SI_HUA.get(year_stem, _EMPTY_READ_ONLY)
             si_hua_in_life = {}
             for hua_type, star_name in si_hua.items():
                 if star_name in stars_in_life_palace:
                     si_hua_in_life[hua_type] = star_name
             
             # 12. 主星 (MajorStar enum)
-            primary_star = self._get_major_star_enum(stars_in_life_palace[0] if stars_in_life_palace else "紫微")
+            primary_star = self.STARS[life_star_ids[0]] if life_star_ids else MajorStar.ZI_WEI
             
             # 13. 五行分布
             element_dist = self._calculate_element_distribution(
@@ -333,9 +420,11 @@ class FateEngine:
             day_stem = day_pillar[0] if day_pillar else "甲"
             inherent_element = self.STEM_ELEMENTS.get(day_stem, Element.WOOD)
 
-            return FateProfile(
+            # Every field is built from engine tables with its final type, so
+            # skip pydantic validation; external data still goes through FateProfile(...)
+            return FateProfile.model_construct(
                 birth_datetime=birth_datetime,
-                lunar_year=lunar.getYear(),
+                lunar_year=lunar_year,
                 lunar_month=lunar_month,
                 lunar_day=lunar_day,
                 lunar_hour=hour_idx,
@@ -346,8 +435,8 @@ class FateEngine:
                 major_star=primary_star,
                 life_palace=f"命宮在{life_palace_branch}",
                 inherent_element=inherent_element,
-                element_distribution=element_dist,
-                extra_data={
+                element_distribution=_ReadOnlyDict(element_dist),
+                extra_data=_ReadOnlyDict({
                     "life_palace_branch": life_palace_branch,
                     "life_palace_idx": life_palace_idx,
                     "wu_xing_ju": ju_name,
@@ -355,10 +444,13 @@ class FateEngine:
                     "zi_wei_position": self.BRANCHES[zi_wei_idx],
                     "tian_fu_position": self.BRANCHES[tian_fu_idx],
                     "all_major_stars": stars_in_life_palace,
-                    "star_positions": {k: self.BRANCHES[v] for k, v in star_positions.items()},
+                    # Deprecated verbose form, kept for existing readers; prefer the compact one
+                    "star_positions": _ReadOnlyDict({k: self.BRANCHES[v] for k, v in zip(self.STAR_NAMES, star_positions)}),
+                    # Branch index per star in STAR_NAMES order (MajorStar declaration order)
+                    "star_positions_compact": star_positions,
                     "si_hua": si_hua,
-                    "si_hua_in_life": si_hua_in_life,
-                }
+                    "si_hua_in_life": _ReadOnlyDict(si_hua_in_life),
+                }),
             )
 
         except Exception as e:
@@ -369,60 +461,71 @@ class FateEngine:
                 details={"birth_datetime": str(birth_datetime)},
             )
 
-    def _get_hour_index(self, hour: int) -> int:
-        """Convert 24-hour to 時辰 index (0=子, 1=丑, ...)"""
-        if hour == 23:
-            return 0
-        return ((hour + 1) // 2) % 12
-
-    def _get_major_star_enum(self, star_name: str) -> MajorStar:
-        """Convert star name to MajorStar enum."""
-        mapping = {
-            "紫微": MajorStar.ZI_WEI, "天機": MajorStar.TIAN_JI,
-            "太陽": MajorStar.TAI_YANG, "武曲": MajorStar.WU_QU,
-            "天同": MajorStar.TIAN_TONG, "廉貞": MajorStar.LIAN_ZHEN,
-            "天府": MajorStar.TIAN_FU, "太陰": MajorStar.TAI_YIN,
-            "貪狼": MajorStar.TAN_LANG, "巨門": MajorStar.JU_MEN,
-            "天相": MajorStar.TIAN_XIANG, "天梁": MajorStar.TIAN_LIANG,
-            "七殺": MajorStar.QI_SHA, "破軍": MajorStar.PO_JUN,
-        }
-        return mapping.get(star_name, MajorStar.ZI_WEI)
-
     def _calculate_element_distribution(self, *pillars) -> dict:
         """Calculate element distribution from pillars."""
-        distribution = {e: 0 for e in Element}
+        # Literal in Element declaration order: min/max tie-breaks in
+        # FateProfile depend on it
+        distribution = {Element.METAL: 0, Element.WOOD: 0, Element.WATER: 0, Element.FIRE: 0, Element.EARTH: 0}
+        stem_element, branch_element = self.STEM_ELEMENTS.get, self.BRANCH_ELEMENTS.get
         for pillar in pillars:
-            if len(pillar) >= 2:
-                stem, branch = pillar[0], pillar[1]
-                if stem in self.STEM_ELEMENTS:
-                    distribution[self.STEM_ELEMENTS[stem]] += 1
-                if branch in self.BRANCH_ELEMENTS:
-                    distribution[self.BRANCH_ELEMENTS[branch]] += 1
+            # lunar_python yields two-character 干支 pillars; a malformed one
+            # (e.g. the empty pillar calculate_fate tolerates) is skipped alone
+            if len(pillar) < 2:
+                continue
+            element = stem_element(pillar[0])
+            if element is not None:
+                distribution[element] += 1
+            element = branch_element(pillar[1])
+            if element is not None:
+                distribution[element] += 1
         return distribution
 
-    def _validate_birth_datetime(self, dt: datetime) -> None:
+    def _validate_birth_datetime(self, dt: datetime, now: Optional[datetime] = None) -> None:
         """Validate birth datetime."""
         if dt.year < 1900:
             raise InvalidBirthDataError(message="Birth year must be 1900 or later")
-        if dt > datetime.now():
+        if dt > (now or datetime.now()):
             raise InvalidBirthDataError(message="Birth date cannot be in the future")
 
-    def get_star_description(self, star: MajorStar, extra_data: dict = None) -> dict:
+    # 主星描述 (English name + roast)
+    STAR_DESCRIPTIONS = {
+        MajorStar.ZI_WEI: {"name": "紫微", "english": "Emperor Star", "roast": "Control freak with a God complex."},
+        MajorStar.TIAN_JI: {"name": "天機", "english": "Heavenly Secret", "roast": "Overthinks ordering coffee."},
+        MajorStar.TAI_YANG: {"name": "太陽", "english": "Sun Star", "roast": "Everyone's sunshine, nobody's priority."},
+        MajorStar.WU_QU: {"name": "武曲", "english": "Warrior Star", "roast": "You trust money more than people. Smart."},
+        MajorStar.TIAN_TONG: {"name": "天同", "english": "Heavenly Unity", "roast": "Allergic to conflict."},
+        MajorStar.LIAN_ZHEN: {"name": "廉貞", "english": "Chastity Star", "roast": "Drama follows you like a loyal dog."},
+        MajorStar.TIAN_FU: {"name": "天府", "english": "Heavenly Treasury", "roast": "Security is your religion."},
+        MajorStar.TAI_YIN: {"name": "太陰", "english": "Moon Star", "roast": "Trust issues are just pattern recognition."},
+        MajorStar.TAN_LANG: {"name": "貪狼", "english": "Greedy Wolf", "roast": "You want to be a monk and a billionaire. Same time."},
+        MajorStar.JU_MEN: {"name": "巨門", "english": "Giant Gate", "roast": "Truth-teller or troublemaker? Line is thin."},
+        MajorStar.TIAN_XIANG: {"name": "天相", "english": "Heavenly Minister", "roast": "Professional people-pleaser."},
+        MajorStar.TIAN_LIANG: {"name": "天梁", "english": "Heavenly Beam", "roast": "Everyone's therapist, nobody's patient."},
+        MajorStar.QI_SHA: {"name": "七殺", "english": "Seven Killings", "roast": "Born rebel. Authority is just a suggestion."},
+        MajorStar.PO_JUN: {"name": "破軍", "english": "Army Breaker", "roast": "You leave a trail of chaos and call it progress."},
+    }
+    # Shared by every caller, so expose read-only views
+    STAR_DESCRIPTIONS = MappingProxyType(
+        {star: MappingProxyType(info) for star, info in STAR_DESCRIPTIONS.items()}
+    )
+
+    def get_star_description(self, star: MajorStar, extra_data: dict = None) -> Mapping[str, str]:
         """Get star description with roast."""
-        descriptions = {
-            MajorStar.ZI_WEI: {"name": "紫微", "english": "Emperor Star", "roast": "Control freak with a God complex."},
-            MajorStar.TIAN_JI: {"name": "天機", "english": "Heavenly Secret", "roast": "Overthinks ordering coffee."},
-            MajorStar.TAI_YANG: {"name": "太陽", "english": "Sun Star", "roast": "Everyone's sunshine, nobody's priority."},
-            MajorStar.WU_QU: {"name": "武曲", "english": "Warrior Star", "roast": "You trust money more than people. Smart."},
-            MajorStar.TIAN_TONG: {"name": "天同", "english": "Heavenly Unity", "roast": "Allergic to conflict."},
-            MajorStar.LIAN_ZHEN: {"name": "廉貞", "english": "Chastity Star", "roast": "Drama follows you like a loyal dog."},
-            MajorStar.TIAN_FU: {"name": "天府", "english": "Heavenly Treasury", "roast": "Security is your religion."},
-            MajorStar.TAI_YIN: {"name": "太陰", "english": "Moon Star", "roast": "Trust issues are just pattern recognition."},
-            MajorStar.TAN_LANG: {"name": "貪狼", "english": "Greedy Wolf", "roast": "You want to be a monk and a billionaire. Same time."},
-            MajorStar.JU_MEN: {"name": "巨門", "english": "Giant Gate", "roast": "Truth-teller or troublemaker? Line is thin."},
-            MajorStar.TIAN_XIANG: {"name": "天相", "english": "Heavenly Minister", "roast": "Professional people-pleaser."},
-            MajorStar.TIAN_LIANG: {"name": "天梁", "english": "Heavenly Beam", "roast": "Everyone's therapist, nobody's patient."},
-            MajorStar.QI_SHA: {"name": "七殺", "english": "Seven Killings", "roast": "Born rebel. Authority is just a suggestion."},
-            MajorStar.PO_JUN: {"name": "破軍", "english": "Army Breaker", "roast": "You leave a trail of chaos and call it progress."},
-        }
-        return descriptions.get(star, descriptions[MajorStar.ZI_WEI])
+        return self.STAR_DESCRIPTIONS.get(star, self.STAR_DESCRIPTIONS[MajorStar.ZI_WEI])
+
+
+@lru_cache
+def get_engine() -> FateEngine:
+    """Get the shared engine instance."""
+    return FateEngine()
+
+
+@lru_cache(maxsize=4096)
+def _cached_fate(birth_datetime: datetime) -> FateProfile:
+    """
+    Memoized fate calculation for an already validated birth datetime.
+
+    Module-level so every engine shares one cache and no engine holds a
+    reference cycle through a bound-method cache.
+    """
+    return get_engine()._compute_fate(birth_datetime)
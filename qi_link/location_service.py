@@ -6,6 +6,7 @@ Fetches real-time location, weather, and environmental data
 using free APIs (no API keys required).
 """
 
+import asyncio
 import json
 import time
 from dataclasses import dataclass
@@ -14,6 +15,12 @@ from typing import Optional
 import urllib.request
 import urllib.error
 
+# Optional faster parser; both accept the raw response bytes directly
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 @dataclass
 class LocationData:
@@ -48,6 +55,19 @@ class CompassData:
     element: str  # Associated element in Feng Shui
 
 
+def _resolve_degrees(degrees: Optional[float], weather: Optional[WeatherData]) -> float:
+    """
+    Pick the compass heading source and normalize it to [0, 360).
+    
+    Manual input wins, then cached wind direction, then a time-based
+    pseudo-direction (sun position approximation, 15 degrees per hour).
+    Python's % already maps negative headings into range.
+    """
+    if degrees is None:
+        degrees = float(weather.wind_direction_degrees) if weather else datetime.now().hour * 15
+    return degrees % 360
+
+
 class LocationService:
     """
     Service for fetching real-world location and environmental data.
@@ -89,7 +109,7 @@ class LocationService:
             req = urllib.request.Request(url, headers={"User-Agent": "Qi-Link/1.0"})
             
             with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode())
+                data = _json_loads(response.read())
                 
                 if data.get("status") == "success":
                     self._cached_location = LocationData(
@@ -140,7 +160,7 @@ class LocationService:
             req = urllib.request.Request(url, headers={"User-Agent": "Qi-Link/1.0"})
             
             with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode())
+                data = _json_loads(response.read())
                 current = data.get("current", {})
                 
                 weather_code = current.get("weather_code", 0)
@@ -177,22 +197,11 @@ class LocationService:
         Returns:
             CompassData with direction info.
         """
-        if degrees is None:
-            # Try to get from wind direction if weather is cached
-            if self._cached_weather:
-                degrees = float(self._cached_weather.wind_direction_degrees)
-            else:
-                # Fallback: Use time-based pseudo-direction
-                # Maps hour to direction (sun position approximation)
-                hour = datetime.now().hour
-                degrees = (hour * 15) % 360  # 15 degrees per hour
+        degrees = _resolve_degrees(degrees, self._cached_weather)
         
-        # Normalize to 0-360
-        degrees = degrees % 360
-        
-        # Find cardinal direction (8 directions, 45 degrees each)
-        index = int((degrees + 22.5) / 45) % 8
-        abbrev, name, chinese, element = self.CARDINAL_DIRECTIONS[index]
+        # 8 directions, 45 degrees each; degrees is already in [0, 360) so
+        # the truncated index is non-negative and & 7 wraps north-by-west to N
+        abbrev, name, chinese, element = self.CARDINAL_DIRECTIONS[int((degrees + 22.5) / 45) & 7]
         
         return CompassData(
             direction_degrees=degrees,
@@ -276,4 +285,23 @@ class LocationService:
             "weather": weather,
             "compass": compass,
         }
-
+    
+    # Async variants: the blocking HTTP calls run in a worker thread so
+    # callers can overlap them with other work (e.g. fate calculation).
+    
+    async def get_location_async(self) -> Optional[LocationData]:
+        """Non-blocking get_location()."""
+        return await asyncio.to_thread(self.get_location)
+    
+    async def get_weather_async(self, location: Optional[LocationData] = None) -> Optional[WeatherData]:
+        """Non-blocking get_weather()."""
+        return await asyncio.to_thread(self.get_weather, location)
+    
+    async def get_all_environmental_data_async(self) -> dict:
+        """
+        Non-blocking get_all_environmental_data().
+        
+        Location, weather and compass stay sequential: weather needs the
+        location, and the compass reads the freshly cached wind direction.
+        """
+        return await asyncio.to_thread(self.get_all_environmental_data)
@@ -0,0 +1,83 @@
+"""
+Lunar Cache - Persistent Calendar Conversions
+=============================================
+
+Optional SQLite store for solar-to-lunar conversions so repeated birth
+dates skip lunar_python across process restarts. Disabled unless
+QILINK_LUNAR_CACHE_PATH is set; any storage failure silently disables it.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Optional, Tuple
+
+from qi_link.config import get_settings
+
+
+_lock = threading.Lock()
+_connection: Optional[sqlite3.Connection] = None
+_opened = False
+
+
+def _get_connection() -> Optional[sqlite3.Connection]:
+    """Open the configured store on first use (caller holds the lock)."""
+    global _connection, _opened
+    if not _opened:
+        _opened = True
+        path = get_settings().lunar_cache_path
+        if path:
+            path = os.path.expanduser(path)
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                connection = sqlite3.connect(path, check_same_thread=False)
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS lunar (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+                )
+                connection.commit()
+                _connection = connection
+            except (OSError, sqlite3.Error):
+                _connection = None
+    return _connection
+
+
+def _disable() -> None:
+    """Stop using the store after a storage error (caller holds the lock)."""
+    global _connection
+    if _connection is not None:
+        try:
+            _connection.close()
+        except sqlite3.Error:
+            pass
+    _connection = None
+
+
+def load(key: str) -> Optional[Tuple]:
+    """Return the stored conversion for key, or None if absent or disabled."""
+    with _lock:
+        connection = _get_connection()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute("SELECT value FROM lunar WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            _disable()
+            return None
+    return tuple(json.loads(row[0])) if row else None
+
+
+def save(key: str, value: Tuple) -> None:
+    """Persist a conversion; a no-op when the store is disabled."""
+    with _lock:
+        connection = _get_connection()
+        if connection is None:
+            return
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO lunar (key, value) VALUES (?, ?)",
+                (key, json.dumps(value, ensure_ascii=False)),
+            )
+            connection.commit()
+        except sqlite3.Error:
+            _disable()
@@ -10,9 +10,10 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 # =============================================================================
@@ -29,53 +30,32 @@ class Element(str, Enum):
     FIRE = "fire"  # 火 - Passion, transformation, energy
     EARTH = "earth"  # 土 - Stability, nourishment, grounding
 
-    @property
-    def chinese(self) -> str:
-        """Return Chinese character for the element."""
-        mapping = {
-            "metal": "金",
-            "wood": "木",
-            "water": "水",
-            "fire": "火",
-            "earth": "土",
-        }
-        return mapping[self.value]
-
-    @property
-    def color(self) -> str:
-        """Return associated color hex code."""
-        mapping = {
-            "metal": "#C0C0C0",  # Silver
-            "wood": "#228B22",  # Forest Green
-            "water": "#1E90FF",  # Dodger Blue
-            "fire": "#FF4500",  # Orange Red
-            "earth": "#DAA520",  # Golden Rod
-        }
-        return mapping[self.value]
-
-    @property
-    def generates(self) -> "Element":
-        """Return the element this one generates (生)."""
-        cycle = {
-            "metal": Element.WATER,
-            "water": Element.WOOD,
-            "wood": Element.FIRE,
-            "fire": Element.EARTH,
-            "earth": Element.METAL,
-        }
-        return cycle[self.value]
-
-    @property
-    def controls(self) -> "Element":
-        """Return the element this one controls (剋)."""
-        cycle = {
-            "metal": Element.WOOD,
-            "wood": Element.EARTH,
-            "water": Element.FIRE,
-            "fire": Element.METAL,
-            "earth": Element.WATER,
-        }
-        return cycle[self.value]
+    # Display attributes and Wu Xing cycle relations, assigned below once
+    # all members exist
+    chinese: str  # Chinese character for the element
+    color: str  # Associated color hex code
+    generates: "Element"  # The element this one generates (生)
+    generated_by: "Element"  # The element that generates this one (生我)
+    controls: "Element"  # The element this one controls (剋)
+
+
+# Plain member attributes rather than properties: these are read on every diagnosis
+for _element, _chinese, _color, _generates, _controls in (
+    (Element.METAL, "金", "#C0C0C0", Element.WATER, Element.WOOD),  # Silver
+    (Element.WOOD, "木", "#228B22", Element.FIRE, Element.EARTH),  # Forest Green
+    (Element.WATER, "水", "#1E90FF", Element.WOOD, Element.FIRE),  # Dodger Blue
+    (Element.FIRE, "火", "#FF4500", Element.EARTH, Element.METAL),  # Orange Red
+    (Element.EARTH, "土", "#DAA520", Element.METAL, Element.WATER),  # Golden Rod
+):
+    _element.chinese = _chinese
+    _element.color = _color
+    _element.generates = _generates
+    _element.controls = _controls
+    _generates.generated_by = _element
+del _element, _chinese, _color, _generates, _controls
+
+# Balanced environments take their element from the entropy score (score % 5)
+_ENTROPY_ELEMENT_MAP = (Element.METAL, Element.WATER, Element.WOOD, Element.FIRE, Element.EARTH)
 
 
 class EnergyState(str, Enum):
@@ -110,7 +90,23 @@ class MajorStar(str, Enum):
 # =============================================================================
 
 
-class EnvironmentReading(BaseModel):
+class _FrozenModel(BaseModel):
+    """Frozen base for models that cache properties derived from their fields."""
+
+    model_config = ConfigDict(frozen=True)
+
+    def model_copy(self, *, update: Optional[Dict] = None, deep: bool = False) -> _FrozenModel:
+        """Copy the model, dropping cached properties so the copy re-derives them."""
+        copied = super().model_copy(update=update, deep=deep)
+        # model_copy clones __dict__, which also holds cached_property values
+        # computed from the original's (possibly updated) fields
+        cached = copied.__dict__.keys() - type(self).model_fields.keys()
+        for name in cached:
+            del copied.__dict__[name]
+        return copied
+
+
+class EnvironmentReading(_FrozenModel):
     """Real-time environmental readings from the DePIN sensor array."""
 
     timestamp: datetime = Field(default_factory=datetime.now)
@@ -158,7 +154,7 @@ class EnvironmentReading(BaseModel):
     system_uptime_hours: float = Field(..., ge=0)
 
     @computed_field
-    @property
+    @cached_property
     def dominant_environment_element(self) -> Element:
         """Derive dominant element from environment readings."""
         # High temp = Fire, Low temp = Water
@@ -174,18 +170,18 @@ class EnvironmentReading(BaseModel):
             return Element.WOOD
 
         # Balanced state - derive from entropy
-        entropy_element_map = [
-            Element.METAL,
-            Element.WATER,
-            Element.WOOD,
-            Element.FIRE,
-            Element.EARTH,
-        ]
-        return entropy_element_map[self.entropy_score % 5]
+        return _ENTROPY_ELEMENT_MAP[self.entropy_score % 5]
+
 
+class FateProfile(_FrozenModel):
+    """
+    User's astrological profile derived from birth data.
 
-class FateProfile(BaseModel):
-    """User's astrological profile derived from birth data."""
+    Frozen: FateEngine memoizes profiles per birth datetime and hands the
+    same instance to every caller. Like the other models here, derived
+    fields are cached on first access; freezing keeps them valid and
+    model_copy drops them from the copy.
+    """
 
     birth_datetime: datetime
     lunar_year: int
@@ -221,7 +217,7 @@ class FateProfile(BaseModel):
     )
 
     @computed_field
-    @property
+    @cached_property
     def weakest_element(self) -> Element:
         """Find the element most lacking in the chart."""
         if not self.element_distribution:
@@ -229,7 +225,7 @@ class FateProfile(BaseModel):
         return min(self.element_distribution, key=self.element_distribution.get)
 
     @computed_field
-    @property
+    @cached_property
     def strongest_element(self) -> Element:
         """Find the most dominant element in the chart."""
         if not self.element_distribution:
@@ -237,7 +233,7 @@ class FateProfile(BaseModel):
         return max(self.element_distribution, key=self.element_distribution.get)
 
 
-class Diagnosis(BaseModel):
+class Diagnosis(_FrozenModel):
     """Metaphysical diagnosis combining fate and environment."""
 
     fate_profile: FateProfile
@@ -276,13 +272,24 @@ class Diagnosis(BaseModel):
     )
 
     @computed_field
-    @property
+    @cached_property
     def primary_remedy_element(self) -> Element:
         """Get the primary remedy element."""
         return self.remedy_elements[0]
 
+    @cached_property
+    def imbalance_short(self) -> str:
+        """Get the imbalance type (text before the dash) for compact display."""
+        head, sep, _ = self.imbalance_description.partition(" - ")
+        return head if sep else self.imbalance_description[:50]
+
+    @cached_property
+    def remedy_chars(self) -> str:
+        """Remedy elements as space-separated Chinese characters, e.g. "水 木"."""
+        return " ".join([e.chinese for e in self.remedy_elements])
+
 
-class TalismanMetadata(BaseModel):
+class TalismanMetadata(_FrozenModel):
     """Complete metadata for a generated talisman NFT."""
 
     # Identity
@@ -307,39 +314,42 @@ class TalismanMetadata(BaseModel):
     chain_id: int = Field(default=1, description="Mock chain ID (1=Ethereum)")
 
     @computed_field
-    @property
+    @cached_property
     def opensea_attributes(self) -> list[dict]:
-        """Generate OpenSea-compatible attributes."""
+        """Generate OpenSea-compatible attributes (built once; the model is frozen)."""
+        diagnosis = self.diagnosis
+        fate = diagnosis.fate_profile
+        environment = diagnosis.environment
         return [
             {
                 "trait_type": "Major Star",
-                "value": self.diagnosis.fate_profile.major_star.value,
+                "value": fate.major_star.value,
             },
             {
                 "trait_type": "Inherent Element",
-                "value": self.diagnosis.fate_profile.inherent_element.value,
+                "value": fate.inherent_element.value,
             },
             {
                 "trait_type": "Environment Element",
-                "value": self.diagnosis.environment.dominant_environment_element.value,
+                "value": environment.dominant_environment_element.value,
             },
             {
                 "trait_type": "Primary Remedy",
-                "value": self.diagnosis.primary_remedy_element.value,
+                "value": diagnosis.primary_remedy_element.value,
             },
             {
                 "trait_type": "Entropy Score",
-                "value": self.diagnosis.environment.entropy_score,
+                "value": environment.entropy_score,
                 "display_type": "number",
             },
             {
                 "trait_type": "CPU Temperature",
-                "value": round(self.diagnosis.environment.cpu_temperature, 1),
+                "value": round(environment.cpu_temperature, 1),
                 "display_type": "number",
             },
             {
                 "trait_type": "Network Latency",
-                "value": round(self.diagnosis.environment.network_latency_ms, 1),
+                "value": round(environment.network_latency_ms, 1),
                 "display_type": "number",
             },
         ]
@@ -7,12 +7,20 @@ reading real-time machine metrics and converting them into
 metaphysical energy readings.
 """
 
+import errno
 import hashlib
 import platform
+import re
+import socket
+import struct
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 import psutil
 
@@ -21,6 +29,78 @@ from qi_link.exceptions import NetworkProbeError, SensorError, TemperatureReadEr
 from qi_link.models import Element, EnergyState, EnvironmentReading
 
 
+# RTT in ping output (works for most ping outputs)
+_PING_RE = re.compile(r"time[=<](\d+\.?\d*)")
+
+# Entropy sources packed as unsigned 64-bit ints: time ns, perf counter ns,
+# CPU user/system µs, memory used/available, disk read/write bytes,
+# context switches, boot time
+_ENTROPY_STRUCT = struct.Struct("<10Q")
+
+# Indexed by (value >= high) + (value > low): at or below low, between, at or above high
+_ENERGY_STATES = (EnergyState.DEFICIENT, EnergyState.BALANCED, EnergyState.EXCESS)
+
+# Shared by every SensorArray and Streamlit session; threads start lazily
+# on first submit
+_SCAN_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="qi-link-sensor")
+
+
+# CPU usage is process-wide, so the last sample is shared by every SensorArray.
+# psutil measures a non-blocking sample from the previous call on the same
+# thread, so every such call runs on one sampler thread and measures usage
+# since the previous sample. A window shorter than _CPU_MIN_WINDOW only ever
+# reads 0 or 100, so that case falls back to a short blocking sample
+_CPU_MIN_WINDOW = 0.1
+_CPU_SAMPLER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qi-link-cpu")
+_cpu_sample_lock = threading.Lock()
+_last_cpu_sample: Optional[tuple[float, float]] = None  # (monotonic time, percent)
+_cpu_baseline_at = time.monotonic()  # When the sampler thread last called cpu_percent
+
+# Prime the sampler thread's baseline so the first scan needs no blocking sample
+_CPU_SAMPLER.submit(psutil.cpu_percent, None)
+
+
+def _sample_cpu_percent(max_age: float = _CPU_MIN_WINDOW) -> float:
+    """Return CPU usage, reusing the shared sample while it is younger than max_age."""
+    global _last_cpu_sample, _cpu_baseline_at
+    with _cpu_sample_lock:
+        now = time.monotonic()
+        last = _last_cpu_sample
+        if last is not None and now - last[0] < max_age:
+            return last[1]
+        if now - _cpu_baseline_at >= _CPU_MIN_WINDOW:
+            # Usage since the sampler's previous call, without sleeping
+            percent = _CPU_SAMPLER.submit(psutil.cpu_percent, None).result()
+            _cpu_baseline_at = now
+            _last_cpu_sample = (now, percent)
+            return percent
+
+    # Too soon after the previous baseline: block briefly, outside the lock so
+    # concurrent scans are not queued behind the sleep
+    percent = psutil.cpu_percent(interval=_CPU_MIN_WINDOW)
+    with _cpu_sample_lock:
+        _last_cpu_sample = (time.monotonic(), percent)
+    return percent
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    """Clamp value into [low, high]."""
+    return low if value < low else high if value > high else value
+
+
+@dataclass(frozen=True)
+class _SystemSnapshot:
+    """psutil readings taken once per scan and shared by every consumer."""
+    cpu_percent: float
+    cpu_times: Any  # psutil scputimes
+    memory: Any  # psutil svmem
+    disk_read_bytes: int  # 0 when disk counters are unavailable
+    disk_write_bytes: int
+    ctx_switches: int
+    time_ns: int
+    perf_counter_ns: int
+
+
 class SensorArray:
     """
     The DePIN Layer - Real-time hardware diagnostics converted
@@ -40,15 +120,52 @@ class SensorArray:
     LATENCY_HIGH_THRESHOLD = 100.0  # Qi stagnation (Earth)
     LATENCY_LOW_THRESHOLD = 30.0  # Smooth flow (Wood)
 
+    # TCP port timed by the in-process latency probe (8.8.8.8 serves HTTPS)
+    LATENCY_PROBE_PORT = 443
+
+    # Seconds a CPU usage sample stays fresh for get_live_metrics
+    CPU_SAMPLE_TTL = 0.5
+
+    # Seconds a temperature reading is reused across rapid rescans
+    TEMP_SAMPLE_TTL = 0.5
+
+    # psutil sensor names preferred for the CPU package temperature
+    TEMP_SENSOR_NAMES = ("coretemp", "cpu_thermal", "cpu-thermal", "k10temp")
+
+    # Seconds disk IO counters are reused; /proc/diskstats stats every device
+    DISK_IO_TTL = 1.0
+
     def __init__(self):
         """Initialize the sensor array."""
         self._settings = get_settings()
         self._os_type = platform.system().lower()
 
+        # Resolve platform dispatch once instead of re-checking _os_type per scan
+        self._ping_target = self._settings.ping_target
+        self._ping_timeout = self._settings.ping_timeout
+        self._probe_address: Optional[tuple] = None  # (family, sockaddr), resolved on first probe
+        if self._os_type == "windows":
+            self._ping_cmd = ("ping", "-n", "1", "-w", str(int(self._ping_timeout * 1000)), self._ping_target)
+        else:
+            self._ping_cmd = ("ping", "-c", "1", "-W", str(int(self._ping_timeout)), self._ping_target)
+        # macOS: powermetrics/osx-cpu-temp; Windows WMI is usually restricted, so simulate
+        self._read_platform_temperature = (
+            self._read_macos_temperature if self._os_type == "darwin" else self._simulate_temperature
+        )
+        self._boot_time = psutil.boot_time()  # Constant for the life of the process
+        self._scan_cache_ttl = self._settings.scan_cache_ttl
+        self._last_scan: Optional[tuple[float, EnvironmentReading]] = None  # (monotonic time, reading)
+        self._temp_sensor_key: Optional[str] = None  # Found on the first sensor read
+        self._temp_cache: Optional[tuple[float, float]] = None  # (monotonic time, celsius)
+        self._disk_io_cache: Optional[tuple[float, tuple[int, int]]] = None  # (monotonic time, (read, write))
+
     def read_environment(self) -> EnvironmentReading:
         """
         Perform a complete environment scan.
 
+        A scan younger than the scan_cache_ttl setting is returned as-is,
+        so polling UIs do not rescan on every refresh.
+
         Returns:
             EnvironmentReading: Complete environmental metrics with
             metaphysical classifications.
@@ -56,75 +173,136 @@ class SensorArray:
         Raises:
             SensorError: If critical sensors fail.
         """
+        now = time.monotonic()
+        last_scan = self._last_scan
+        if last_scan is not None and now - last_scan[0] < self._scan_cache_ttl:
+            return last_scan[1]
+
         timestamp = datetime.now()
 
-        # Read all metrics
-        cpu_temp = self._read_cpu_temperature()
+        # Read all metrics from one psutil snapshot. The temperature read may
+        # wait on a subprocess, so it runs in the pool while the latency probe
+        # and entropy hash run here. The probe can block for ping_timeout, so
+        # it stays on the calling thread rather than queueing other sessions
+        snapshot = self._take_snapshot()
+        cpu_usage = snapshot.cpu_percent
+        temp_future = _SCAN_POOL.submit(self._read_cpu_temperature, cpu_usage)
         latency = self._measure_network_latency()
-        entropy_hash, entropy_score = self._generate_entropy()
-        cpu_usage = psutil.cpu_percent(interval=0.1)
-        memory_usage = psutil.virtual_memory().percent
+        entropy_hash, entropy_score = self._generate_entropy(snapshot)
+        cpu_temp = temp_future.result()
+        memory_usage = snapshot.memory.percent
         uptime_hours = self._get_system_uptime_hours()
 
         # Classify energy states
         temp_state = self._classify_temperature(cpu_temp)
         qi_state = self._classify_latency(latency)
 
-        return EnvironmentReading(
+        # SensorArray is the only producer: clamp to the model's bounds and skip
+        # pydantic validation (the hash is always 64 hex chars, the score 0-100)
+        reading = EnvironmentReading.model_construct(
             timestamp=timestamp,
-            cpu_temperature=cpu_temp,
+            cpu_temperature=_clamp(cpu_temp, 0.0, 150.0),
             temperature_state=temp_state,
-            network_latency_ms=latency,
+            network_latency_ms=max(latency, 0.0),
             qi_flow_state=qi_state,
             entropy_hash=entropy_hash,
             entropy_score=entropy_score,
-            cpu_usage_percent=cpu_usage,
-            memory_usage_percent=memory_usage,
-            system_uptime_hours=uptime_hours,
+            cpu_usage_percent=_clamp(cpu_usage, 0.0, 100.0),
+            memory_usage_percent=_clamp(memory_usage, 0.0, 100.0),
+            system_uptime_hours=max(uptime_hours, 0.0),
         )
+        self._last_scan = (now, reading)
+        return reading
 
-    def _read_cpu_temperature(self) -> float:
+    def _take_snapshot(self) -> _SystemSnapshot:
+        """Read every psutil source a scan needs, once."""
+        try:
+            ctx_switches = psutil.cpu_stats().ctx_switches  # No /proc scan, unlike pids()
+        except (PermissionError, OSError):
+            ctx_switches = hash(time.time_ns()) % 1000  # Fallback to pseudo-random
+
+        disk_read, disk_write = self._read_disk_io()
+
+        return _SystemSnapshot(
+            cpu_percent=_sample_cpu_percent(),
+            cpu_times=psutil.cpu_times(),
+            memory=psutil.virtual_memory(),
+            disk_read_bytes=disk_read,
+            disk_write_bytes=disk_write,
+            ctx_switches=ctx_switches,
+            time_ns=time.time_ns(),
+            perf_counter_ns=time.perf_counter_ns(),
+        )
+
+    def _read_disk_io(self) -> tuple[int, int]:
+        """Get (read_bytes, write_bytes), re-reading the counters at most once per DISK_IO_TTL."""
+        now = time.monotonic()
+        cached = self._disk_io_cache
+        if cached is not None and now - cached[0] < self.DISK_IO_TTL:
+            return cached[1]
+
+        try:
+            disk_io = psutil.disk_io_counters() if hasattr(psutil, "disk_io_counters") else None
+        except (PermissionError, OSError):
+            disk_io = None
+        counters = (disk_io.read_bytes, disk_io.write_bytes) if disk_io else (0, 0)
+        self._disk_io_cache = (now, counters)
+        return counters
+
+    def _read_cpu_temperature(self, cpu_usage: Optional[float] = None) -> float:
         """
         Read CPU temperature using psutil or OS-specific methods.
 
         On systems where temperature reading is blocked, returns a
         simulated value based on CPU usage.
 
+        Args:
+            cpu_usage: Already sampled CPU usage for the simulation fallback.
+
         Returns:
             float: CPU temperature in Celsius.
         """
+        now = time.monotonic()
+        cached = self._temp_cache
+        if cached is not None and now - cached[0] < self.TEMP_SAMPLE_TTL:
+            return cached[1]
+
+        temperature = self._read_cpu_temperature_uncached(cpu_usage)
+        self._temp_cache = (now, temperature)
+        return temperature
+
+    def _read_cpu_temperature_uncached(self, cpu_usage: Optional[float]) -> float:
+        """Read the CPU temperature from the hardware, falling back to simulation."""
         try:
             # Try psutil sensors_temperatures (Linux)
             if hasattr(psutil, "sensors_temperatures"):
                 temps = psutil.sensors_temperatures()
                 if temps:
-                    # Try common sensor names
-                    for sensor_name in ["coretemp", "cpu_thermal", "cpu-thermal", "k10temp"]:
-                        if sensor_name in temps:
-                            readings = temps[sensor_name]
-                            if readings:
-                                return readings[0].current
-
-                    # Fallback to first available sensor
-                    first_sensor = list(temps.values())[0]
-                    if first_sensor:
-                        return first_sensor[0].current
-
-            # macOS: Use powermetrics or simulate
-            if self._os_type == "darwin":
-                return self._read_macos_temperature()
-
-            # Windows: Try WMI (usually restricted)
-            if self._os_type == "windows":
-                return self._simulate_temperature()
+                    # Search the sensor names once, then index directly
+                    key = self._temp_sensor_key
+                    if key is None:
+                        key = self._temp_sensor_key = self._probe_sensor_key(temps)
+                    readings = temps.get(key)
+                    if readings:
+                        return readings[0].current
+
+            # macOS: Use powermetrics or simulate; elsewhere simulate
+            return self._read_platform_temperature(cpu_usage)
 
         except Exception:
             pass
 
         # Fallback: Simulate based on CPU usage
-        return self._simulate_temperature()
+        return self._simulate_temperature(cpu_usage)
 
-    def _read_macos_temperature(self) -> float:
+    def _probe_sensor_key(self, temps: dict) -> str:
+        """Pick a common CPU sensor name, falling back to the first available sensor."""
+        for sensor_name in self.TEMP_SENSOR_NAMES:
+            if temps.get(sensor_name):
+                return sensor_name
+        return next(iter(temps))
+
+    def _read_macos_temperature(self, cpu_usage: Optional[float] = None) -> float:
         """Attempt to read macOS temperature or simulate."""
         try:
             # Try osx-cpu-temp if installed
@@ -141,42 +319,45 @@ class SensorArray:
         except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
             pass
 
-        return self._simulate_temperature()
+        return self._simulate_temperature(cpu_usage)
 
-    def _simulate_temperature(self) -> float:
+    def _simulate_temperature(self, cpu_usage: Optional[float] = None) -> float:
         """
         Simulate CPU temperature based on usage patterns.
 
-        Uses CPU usage to estimate temperature with realistic variance.
+        Uses CPU usage to estimate temperature with realistic variance;
+        samples it only when the caller has not already done so.
         """
-        cpu_usage = psutil.cpu_percent(interval=0.1)
+        if cpu_usage is None:
+            cpu_usage = _sample_cpu_percent()
 
         # Base temperature + usage-based heat + random variance
         base_temp = 35.0
         usage_heat = (cpu_usage / 100.0) * 45.0  # Max 45°C from usage
-        time_variance = (hash(str(time.time_ns())) % 100) / 50.0 - 1.0  # ±1°C
+        time_variance = ((time.time_ns() >> 8) % 200) / 100.0 - 1.0  # ±1°C
 
         return round(base_temp + usage_heat + time_variance, 1)
 
     def _measure_network_latency(self) -> float:
         """
-        Measure network latency by pinging target.
+        Measure network latency to the ping target.
+
+        Times a TCP handshake in-process; only when that probe cannot run
+        does it spawn the system ping.
 
         Returns:
             float: Round-trip time in milliseconds.
         """
-        target = self._settings.ping_target
-        timeout = self._settings.ping_timeout
+        timeout = self._ping_timeout
 
-        try:
-            if self._os_type == "windows":
-                cmd = ["ping", "-n", "1", "-w", str(int(timeout * 1000)), target]
-            else:
-                cmd = ["ping", "-c", "1", "-W", str(int(timeout)), target]
+        latency = self._measure_tcp_latency()
+        if latency is not None:
+            return latency
 
+        try:
             start = time.perf_counter()
             result = subprocess.run(
-                cmd,
+                self._ping_cmd,
                 capture_output=True,
                 text=True,
                 timeout=timeout + 1,
@@ -187,10 +368,7 @@ class SensorArray:
                 # Parse actual RTT from output if possible
                 output = result.stdout
                 if "time=" in output:
-                    # Extract time value (works for most ping outputs)
-                    import re
-
-                    match = re.search(r"time[=<](\d+\.?\d*)", output)
+                    match = _PING_RE.search(output)
                     if match:
                         return float(match.group(1))
                 return elapsed
@@ -203,13 +381,48 @@ class SensorArray:
         # Fallback: simulate latency
         return self._simulate_latency()
 
+    def _measure_tcp_latency(self) -> Optional[float]:
+        """
+        Time a TCP connect to the ping target.
+
+        A refused connection still completes a round trip, so it counts.
+        DNS is resolved once and kept out of the timing.
+
+        Returns:
+            Optional[float]: RTT in milliseconds, the timeout as high latency,
+            or None if the probe could not run.
+        """
+        try:
+            if self._probe_address is None:
+                family, _, _, _, sockaddr = socket.getaddrinfo(
+                    self._ping_target, self.LATENCY_PROBE_PORT, type=socket.SOCK_STREAM
+                )[0]
+                self._probe_address = (family, sockaddr)
+            family, sockaddr = self._probe_address
+
+            with socket.socket(family, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self._ping_timeout)
+                start = time.perf_counter_ns()
+                err = sock.connect_ex(sockaddr)
+                elapsed = (time.perf_counter_ns() - start) / 1_000_000
+        except socket.timeout:
+            return self._ping_timeout * 1000
+        except OSError:
+            return None
+
+        if err in (0, errno.ECONNREFUSED):
+            return elapsed
+        if err in (errno.ETIMEDOUT, errno.EAGAIN, errno.EWOULDBLOCK):
+            return self._ping_timeout * 1000
+        return None
+
     def _simulate_latency(self) -> float:
         """Simulate network latency with realistic patterns."""
         base_latency = 25.0
-        variance = (hash(str(time.time_ns())) % 100) / 2.0  # 0-50ms variance
-        return round(base_latency + variance, 1)
+        variance = ((time.perf_counter_ns() >> 4) % 100) / 2.0  # 0-50ms variance
+        return base_latency + variance  # Already a multiple of 0.5, no rounding needed
 
-    def _generate_entropy(self) -> tuple[str, int]:
+    def _generate_entropy(self, snapshot: Optional[_SystemSnapshot] = None) -> tuple[str, int]:
         """
         Generate entropy hash and volatility score.
 
@@ -218,65 +431,54 @@ class SensorArray:
         - Current timestamp (nanosecond)
         - CPU times
         - Memory stats
-        - Process count (if available)
+        - Context switch count (if available)
+
+        Args:
+            snapshot: The scan's psutil readings; taken fresh when omitted.
 
         Returns:
             tuple[str, int]: (256-bit hex hash, volatility score 0-100)
         """
-        # Gather entropy sources (with graceful fallbacks)
-        try:
-            pid_count = len(psutil.pids())
-        except (PermissionError, OSError):
-            pid_count = hash(time.time_ns()) % 1000  # Fallback to pseudo-random
-
-        try:
-            disk_io = str(psutil.disk_io_counters()) if hasattr(psutil, "disk_io_counters") else ""
-        except (PermissionError, OSError):
-            disk_io = ""
-
-        sources = [
-            str(time.time_ns()),
-            str(time.perf_counter_ns()),
-            str(psutil.cpu_times()),
-            str(psutil.virtual_memory()),
-            disk_io,
-            str(pid_count),
-            str(psutil.boot_time()),
-        ]
-
-        # Combine and hash
-        combined = "|".join(sources)
-        entropy_hash = hashlib.sha256(combined.encode()).hexdigest()
+        if snapshot is None:
+            snapshot = self._take_snapshot()
+        cpu_times, memory = snapshot.cpu_times, snapshot.memory
+
+        # Pack as raw integers and hash once; hex only for the result
+        digest = hashlib.sha256(
+            _ENTROPY_STRUCT.pack(
+                snapshot.time_ns,
+                snapshot.perf_counter_ns,
+                int(cpu_times.user * 1e6),
+                int(cpu_times.system * 1e6),
+                memory.used,
+                memory.available,
+                snapshot.disk_read_bytes,
+                snapshot.disk_write_bytes,
+                snapshot.ctx_switches,
+                int(self._boot_time),
+            )
+        ).digest()
+        entropy_hash = digest.hex()
 
         # Calculate volatility score from hash distribution
-        # Count unique characters and their positions
-        char_variance = len(set(entropy_hash))
-        position_sum = sum(int(c, 16) for c in entropy_hash[:16])
-        volatility_score = int((char_variance + position_sum) % 101)
+        # Count unique bytes and sum the leading ones
+        byte_variance = len(set(digest))
+        position_sum = sum(digest[:8])
+        volatility_score = (byte_variance + position_sum) % 101
 
         return entropy_hash, volatility_score
 
     def _get_system_uptime_hours(self) -> float:
         """Get system uptime in hours."""
-        boot_time = psutil.boot_time()
-        uptime_seconds = time.time() - boot_time
-        return round(uptime_seconds / 3600, 2)
+        return round((time.time() - self._boot_time) / 3600, 2)
 
     def _classify_temperature(self, temp: float) -> EnergyState:
         """Classify temperature into energy state."""
-        if temp >= self.TEMP_HIGH_THRESHOLD:
-            return EnergyState.EXCESS
-        elif temp <= self.TEMP_LOW_THRESHOLD:
-            return EnergyState.DEFICIENT
-        return EnergyState.BALANCED
+        return _ENERGY_STATES[(temp >= self.TEMP_HIGH_THRESHOLD) + (temp > self.TEMP_LOW_THRESHOLD)]
 
     def _classify_latency(self, latency: float) -> EnergyState:
-        """Classify latency into Qi flow state."""
-        if latency >= self.LATENCY_HIGH_THRESHOLD:
-            return EnergyState.EXCESS  # Stagnation
-        elif latency <= self.LATENCY_LOW_THRESHOLD:
-            return EnergyState.DEFICIENT  # Smooth (needs grounding)
-        return EnergyState.BALANCED
+        """Classify latency into Qi flow state (excess = stagnation, deficient = smooth, needs grounding)."""
+        return _ENERGY_STATES[(latency >= self.LATENCY_HIGH_THRESHOLD) + (latency > self.LATENCY_LOW_THRESHOLD)]
 
     def get_live_metrics(self) -> dict:
         """
@@ -285,9 +487,25 @@ class SensorArray:
         Returns:
             dict: Current CPU and memory usage for progress bars.
         """
+        now = time.monotonic()
+
+        # Serve CPU and memory from a fresh scan, else reuse a fresh CPU sample
+        last_scan = self._last_scan
+        if last_scan is not None and now - last_scan[0] < self._scan_cache_ttl:
+            reading = last_scan[1]
+            cpu_percent, memory_percent = reading.cpu_usage_percent, reading.memory_usage_percent
+        else:
+            cpu_percent = _sample_cpu_percent(self.CPU_SAMPLE_TTL)
+            memory_percent = psutil.virtual_memory().percent
+
         return {
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
-            "memory_percent": psutil.virtual_memory().percent,
+            "cpu_percent": cpu_percent,
+            "memory_percent": memory_percent,
             "disk_percent": psutil.disk_usage("/").percent,
         }
 
+
+@lru_cache
+def get_sensor_array() -> SensorArray:
+    """Get the shared sensor array, so its scan and sample caches persist across reruns."""
+    return SensorArray()
@@ -6,153 +6,29 @@ Handles talisman image generation using OpenAI DALL-E 3
 with mock fallback for development.
 """
 
-import base64
+import re
+from base64 import b64encode
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
 from qi_link.config import get_settings
 from qi_link.exceptions import APIKeyMissingError, ImageGenerationError
 from qi_link.models import Diagnosis, Element
 
 
-class TalismanGenerator:
-    """AI-powered talisman image generator using DALL-E 3."""
-
-    # Ba Gua trigrams for each element
-    BAGUA_SYMBOLS = {
-        Element.METAL: ("☰", "乾"),
-        Element.WOOD: ("☴", "巽"),
-        Element.WATER: ("☵", "坎"),
-        Element.FIRE: ("☲", "離"),
-        Element.EARTH: ("☷", "坤"),
-    }
-
-    def __init__(self):
-        self._settings = get_settings()
-        self._openai_client = None
-
-    def _get_openai_client(self):
-        if self._openai_client is None:
-            if not self._settings.has_openai_key:
-                raise APIKeyMissingError()
-            from openai import OpenAI
-            self._openai_client = OpenAI(api_key=self._settings.openai_api_key.get_secret_value())
-        return self._openai_client
-
-    def generate(self, diagnosis: Diagnosis) -> str:
-        if self._settings.mock_mode or not self._settings.has_openai_key:
-            return self._generate_mock_talisman(diagnosis)
-        return self._generate_dalle_talisman(diagnosis)
+def _minify_svg(markup: str) -> str:
+    """Strip comments and collapse whitespace in a template (run once at import)."""
+    markup = re.sub(r"<!--.*?-->|/\*.*?\*/", "", markup, flags=re.S)
+    markup = re.sub(r"\s+", " ", markup)
+    return re.sub(r">\s+<", "><", markup).strip()
 
-    def _generate_dalle_talisman(self, diagnosis: Diagnosis) -> str:
-        try:
-            client = self._get_openai_client()
-            response = client.images.generate(
-                model=self._settings.openai_model,
-                prompt=diagnosis.talisman_prompt,
-                size=self._settings.openai_image_size,
-                quality=self._settings.openai_image_quality,
-                n=1,
-            )
-            return response.data[0].url
-        except APIKeyMissingError:
-            raise
-        except Exception as e:
-            raise ImageGenerationError(
-                message=f"DALL-E generation failed: {str(e)}", 
-                details={"model": self._settings.openai_model}
-            )
 
-    def _generate_mock_talisman(self, diagnosis: Diagnosis) -> str:
-        """Generate a circular mandala talisman SVG."""
-        primary_element = diagnosis.primary_remedy_element
-        secondary_element = (
-            diagnosis.remedy_elements[1] 
-            if len(diagnosis.remedy_elements) > 1 
-            else diagnosis.fate_profile.inherent_element
-        )
-        
-        colors = self._get_element_colors(primary_element)
-        secondary_colors = self._get_element_colors(secondary_element)
-        
-        star_symbol = diagnosis.fate_profile.major_star.value
-        element_char = primary_element.chinese
-        bagua_symbol, _ = self.BAGUA_SYMBOLS.get(primary_element, ("☯", "道"))
-        
-        # Four pillars
-        pillars = diagnosis.fate_profile
-        
-        svg = self._create_circular_talisman(
-            colors=colors,
-            secondary_colors=secondary_colors,
-            star_symbol=star_symbol,
-            element_char=element_char,
-            bagua_symbol=bagua_symbol,
-            pillars=pillars,
-            remedy_elements=diagnosis.remedy_elements
-        )
-        
-        b64 = base64.b64encode(svg.encode("utf-8")).decode("utf-8")
-        return f"data:image/svg+xml;base64,{b64}"
-
-    def _get_element_colors(self, element: Element) -> dict:
-        palettes = {
-            Element.METAL: {
-                "primary": "#C0C0C0",
-                "secondary": "#E8E8E8", 
-                "accent": "#FFFFFF",
-                "glow": "#FFFFFF",
-                "dark": "#808080"
-            },
-            Element.WOOD: {
-                "primary": "#00CC66",
-                "secondary": "#00FF88",
-                "accent": "#66FFAA",
-                "glow": "#00FF88",
-                "dark": "#008844"
-            },
-            Element.WATER: {
-                "primary": "#0088FF",
-                "secondary": "#00BFFF",
-                "accent": "#66D9FF",
-                "glow": "#00BFFF",
-                "dark": "#0055AA"
-            },
-            Element.FIRE: {
-                "primary": "#FF4400",
-                "secondary": "#FF6600",
-                "accent": "#FFAA00",
-                "glow": "#FF6600",
-                "dark": "#CC2200"
-            },
-            Element.EARTH: {
-                "primary": "#DDAA00",
-                "secondary": "#FFD700",
-                "accent": "#FFEE66",
-                "glow": "#FFD700",
-                "dark": "#AA7700"
-            },
-        }
-        return palettes.get(element, palettes[Element.FIRE])
+# The fragments below are minified at import: every byte costs 4/3 in the
+# base64 data URL
 
-    def _create_circular_talisman(
-        self, colors, secondary_colors, star_symbol, element_char,
-        bagua_symbol, pillars, remedy_elements
-    ) -> str:
-        """Create a circular mandala talisman with strong visual effects."""
-        
-        p = colors["primary"]
-        s = colors["secondary"]
-        a = colors["accent"]
-        g = colors["glow"]
-        d = colors["dark"]
-        sp = secondary_colors["primary"]
-        
-        year = pillars.year_stem_branch
-        month = pillars.month_stem_branch
-        day = pillars.day_stem_branch
-        hour = pillars.hour_stem_branch
-        
-        remedy_chars = " ".join([e.chinese for e in remedy_elements])
-        
-        return f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 600 600" width="600" height="600">
+# Root element and gradient/filter defs; format with the palette colors
+_SVG_DEFS = _minify_svg('''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 600 600">
 <defs>
     <!-- Radial gradient background -->
     <radialGradient id="bgGrad" cx="50%" cy="50%" r="60%">
@@ -203,63 +79,69 @@ class TalismanGenerator:
     </filter>
 </defs>
 
-<style>
+''')
+
+# Animation stylesheet, identical for every talisman (kept pre-encoded)
+_SVG_STYLE = _minify_svg('''<style>
     /* Slow rotation animation */
-    @keyframes rotate {{
-        from {{ transform: rotate(0deg); }}
-        to {{ transform: rotate(360deg); }}
-    }}
+    @keyframes rotate {
+        from { transform: rotate(0deg); }
+        to { transform: rotate(360deg); }
+    }
     
-    @keyframes rotateReverse {{
-        from {{ transform: rotate(360deg); }}
-        to {{ transform: rotate(0deg); }}
-    }}
+    @keyframes rotateReverse {
+        from { transform: rotate(360deg); }
+        to { transform: rotate(0deg); }
+    }
     
     /* Pulsing glow animation */
-    @keyframes pulse {{
-        0%, 100% {{ opacity: 0.4; }}
-        50% {{ opacity: 0.8; }}
-    }}
+    @keyframes pulse {
+        0%, 100% { opacity: 0.4; }
+        50% { opacity: 0.8; }
+    }
     
-    @keyframes pulseSlow {{
-        0%, 100% {{ opacity: 0.3; }}
-        50% {{ opacity: 0.6; }}
-    }}
+    @keyframes pulseSlow {
+        0%, 100% { opacity: 0.3; }
+        50% { opacity: 0.6; }
+    }
     
     /* Breathing scale animation */
-    @keyframes breathe {{
-        0%, 100% {{ transform: scale(1); }}
-        50% {{ transform: scale(1.02); }}
-    }}
+    @keyframes breathe {
+        0%, 100% { transform: scale(1); }
+        50% { transform: scale(1.02); }
+    }
     
     /* Floating animation */
-    @keyframes float {{
-        0%, 100% {{ transform: translateY(0); }}
-        50% {{ transform: translateY(-5px); }}
-    }}
+    @keyframes float {
+        0%, 100% { transform: translateY(0); }
+        50% { transform: translateY(-5px); }
+    }
     
-    .rotate-slow {{ 
+    .rotate-slow { 
         animation: rotate 60s linear infinite; 
         transform-origin: 300px 300px;
-    }}
+    }
     
-    .rotate-medium {{ 
+    .rotate-medium { 
         animation: rotate 30s linear infinite; 
         transform-origin: 300px 300px;
-    }}
+    }
     
-    .rotate-reverse {{ 
+    .rotate-reverse { 
         animation: rotateReverse 45s linear infinite; 
         transform-origin: 300px 300px;
-    }}
+    }
     
-    .pulse {{ animation: pulse 3s ease-in-out infinite; }}
-    .pulse-slow {{ animation: pulseSlow 5s ease-in-out infinite; }}
-    .breathe {{ animation: breathe 4s ease-in-out infinite; transform-origin: 300px 300px; }}
-    .float {{ animation: float 3s ease-in-out infinite; }}
+    .pulse { animation: pulse 3s ease-in-out infinite; }
+    .pulse-slow { animation: pulseSlow 5s ease-in-out infinite; }
+    .breathe { animation: breathe 4s ease-in-out infinite; transform-origin: 300px 300px; }
+    .float { animation: float 3s ease-in-out infinite; }
 </style>
 
-<!-- Background -->
+''').encode("utf-8")
+
+# Background and rings, up to the opening of the energy-line group
+_SVG_FRAME = _minify_svg('''<!-- Background -->
 <rect width="600" height="600" fill="url(#bgGrad)"/>
 
 <!-- Center glow effect - breathing -->
@@ -280,7 +162,16 @@ class TalismanGenerator:
 
 <!-- Rotating energy lines - medium speed rotation -->
 <g filter="url(#glow)" class="rotate-medium">
-    {"".join([f'<line x1="300" y1="{300-180}" x2="300" y2="{300-220}" stroke="{a}" stroke-width="2" opacity="0.7" transform="rotate({i*30}, 300, 300)"/>' for i in range(12)])}
+    ''')
+
+# Twelve rotating energy lines, 30 degrees apart; only the accent color varies
+_SVG_ENERGY_LINES = "".join(
+    f'<line x1="300" y1="120" x2="300" y2="80" stroke="{{a}}" stroke-width="2" opacity="0.7" transform="rotate({i*30}, 300, 300)"/>'
+    for i in range(12)
+)
+
+# Energy dots, octagons and Ba Gua trigrams
+_SVG_ORNAMENTS = _minify_svg('''
 </g>
 
 <!-- Energy dots on outer ring - pulsing -->
@@ -317,7 +208,10 @@ class TalismanGenerator:
     <text x="158" y="158" text-anchor="middle">☷</text>
 </g>
 
-<!-- Central star symbol - main focus with floating animation -->
+''')
+
+# Chart text (star, element, trigram, pillars, remedy) and inner circles
+_SVG_CENTER = _minify_svg('''<!-- Central star symbol - main focus with floating animation -->
 <text x="300" y="280" font-family="serif" font-size="72" fill="{s}" text-anchor="middle" filter="url(#strongGlow)" class="float">{star_symbol}</text>
 
 <!-- Element character - pulsing -->
@@ -342,4 +236,180 @@ class TalismanGenerator:
 <circle cx="300" cy="300" r="130" fill="none" stroke="{g}" stroke-width="1" opacity="0.4" filter="url(#glow)"/>
 <circle cx="300" cy="300" r="100" fill="none" stroke="{p}" stroke-width="0.5" opacity="0.3"/>
 
-</svg>'''
+</svg>''')
+
+
+# Palette per element, built once; read-only since every talisman shares them
+_ELEMENT_PALETTES = {
+    Element.METAL: MappingProxyType({
+        "primary": "#C0C0C0",
+        "secondary": "#E8E8E8", 
+        "accent": "#FFFFFF",
+        "glow": "#FFFFFF",
+        "dark": "#808080"
+    }),
+    Element.WOOD: MappingProxyType({
+        "primary": "#00CC66",
+        "secondary": "#00FF88",
+        "accent": "#66FFAA",
+        "glow": "#00FF88",
+        "dark": "#008844"
+    }),
+    Element.WATER: MappingProxyType({
+        "primary": "#0088FF",
+        "secondary": "#00BFFF",
+        "accent": "#66D9FF",
+        "glow": "#00BFFF",
+        "dark": "#0055AA"
+    }),
+    Element.FIRE: MappingProxyType({
+        "primary": "#FF4400",
+        "secondary": "#FF6600",
+        "accent": "#FFAA00",
+        "glow": "#FF6600",
+        "dark": "#CC2200"
+    }),
+    Element.EARTH: MappingProxyType({
+        "primary": "#DDAA00",
+        "secondary": "#FFD700",
+        "accent": "#FFEE66",
+        "glow": "#FFD700",
+        "dark": "#AA7700"
+    }),
+}
+
+
+class TalismanGenerator:
+    """AI-powered talisman image generator using DALL-E 3."""
+
+    # Ba Gua trigrams for each element
+    BAGUA_SYMBOLS = {
+        Element.METAL: ("☰", "乾"),
+        Element.WOOD: ("☴", "巽"),
+        Element.WATER: ("☵", "坎"),
+        Element.FIRE: ("☲", "離"),
+        Element.EARTH: ("☷", "坤"),
+    }
+
+    def __init__(self):
+        self._settings = get_settings()
+        self._has_key = self._settings.has_openai_key
+        self._api_key = self._settings.openai_api_key if self._has_key else None
+        self._openai_client = None
+
+    def _get_openai_client(self):
+        client = self._openai_client
+        if client is None:
+            if not self._has_key:
+                raise APIKeyMissingError()
+            from openai import OpenAI
+            client = self._openai_client = OpenAI(api_key=self._api_key.get_secret_value())
+        return client
+
+    def generate(self, diagnosis: Diagnosis) -> str:
+        if self._settings.mock_mode or not self._has_key:
+            return self._generate_mock_talisman(diagnosis)
+        return self._generate_dalle_talisman(diagnosis)
+
+    def _generate_dalle_talisman(self, diagnosis: Diagnosis) -> str:
+        settings = self._settings
+        model = settings.openai_model
+        try:
+            generate_image = self._get_openai_client().images.generate
+            response = generate_image(
+                model=model,
+                prompt=diagnosis.talisman_prompt,
+                size=settings.openai_image_size,
+                quality=settings.openai_image_quality,
+                n=1,
+            )
+            return response.data[0].url
+        except APIKeyMissingError:
+            raise
+        except Exception as e:
+            raise ImageGenerationError(
+                message=f"DALL-E generation failed: {str(e)}", 
+                details={"model": model}
+            )
+
+    def _generate_mock_talisman(self, diagnosis: Diagnosis) -> str:
+        """Generate a circular mandala talisman SVG."""
+        fate = diagnosis.fate_profile
+        remedy_elements = diagnosis.remedy_elements
+        secondary_element = (
+            remedy_elements[1] 
+            if len(remedy_elements) > 1 
+            else fate.inherent_element
+        )
+        
+        return self._render_mock_talisman(
+            diagnosis.primary_remedy_element,
+            secondary_element,
+            fate.major_star.value,
+            # Four pillars
+            (fate.year_stem_branch, fate.month_stem_branch, fate.day_stem_branch, fate.hour_stem_branch),
+            diagnosis.remedy_chars,
+        )
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _render_mock_talisman(
+        cls, primary_element, secondary_element, star_symbol, pillars, remedy_chars
+    ) -> str:
+        """Render the talisman data URL; pure in its hashable arguments, so memoized across instances."""
+        colors = cls._get_element_colors(primary_element)
+        secondary_colors = cls._get_element_colors(secondary_element)
+        
+        element_char = primary_element.chinese
+        bagua_symbol, _ = cls.BAGUA_SYMBOLS.get(primary_element, ("☯", "道"))
+        
+        svg = cls._create_circular_talisman(
+            colors=colors,
+            secondary_colors=secondary_colors,
+            star_symbol=star_symbol,
+            element_char=element_char,
+            bagua_symbol=bagua_symbol,
+            pillars=pillars,
+            remedy_chars=remedy_chars
+        )
+        
+        return (b"data:image/svg+xml;base64," + b64encode(svg)).decode("ascii")
+
+    @staticmethod
+    def _get_element_colors(element: Element) -> Mapping[str, str]:
+        return _ELEMENT_PALETTES.get(element, _ELEMENT_PALETTES[Element.FIRE])
+
+    @staticmethod
+    def _create_circular_talisman(
+        colors, secondary_colors, star_symbol, element_char,
+        bagua_symbol, pillars, remedy_chars
+    ) -> bytes:
+        """Create a circular mandala talisman with strong visual effects, as UTF-8 SVG bytes."""
+        
+        p = colors["primary"]
+        s = colors["secondary"]
+        a = colors["accent"]
+        g = colors["glow"]
+        d = colors["dark"]
+        sp = secondary_colors["primary"]
+        
+        year, month, day, hour = pillars
+        
+        # Static pieces are appended as-is; only the color/text fragments are
+        # formatted and encoded, so the stylesheet never goes through UTF-8 again
+        parts = [
+            _SVG_DEFS.format(p=p, s=s, g=g, d=d).encode("utf-8"),
+            _SVG_STYLE,
+            _SVG_FRAME.format(p=p, s=s, g=g).encode("utf-8"),
+            _SVG_ENERGY_LINES.format(a=a).encode("utf-8"),
+            _SVG_ORNAMENTS.format(p=p, s=s, a=a).encode("utf-8"),
+            _SVG_CENTER.format(
+                p=p, s=s, a=a, g=g,
+                star_symbol=star_symbol,
+                element_char=element_char,
+                bagua_symbol=bagua_symbol,
+                year=year, month=month, day=day, hour=hour,
+                remedy_chars=remedy_chars,
+            ).encode("utf-8"),
+        ]
+        return b"".join(parts)
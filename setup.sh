@@ -42,7 +42,7 @@ pip install 'numpy<2' --quiet
 pip install 'streamlit>=1.28.0,<1.30.0' --quiet
 pip install lunar_python --quiet
 pip install openai --quiet
-pip install web3 --quiet
+pip install pycryptodome --quiet
 pip install psutil --quiet
 pip install pydantic pydantic-settings --quiet
 